@@ -2176,11 +2176,16 @@ def _fill_bisector(bisect: np.ndarray, open_k: np.ndarray, open_j: np.ndarray, o
     nj: int = bisect.shape[1]
     ni: int = bisect.shape[2]
     going: bool = True
+    forward: bool = True
     while going:
         going = False
-        for k in range(nk):
-            for j in range(nj):
-                for i in range(ni):
+        # alternate sweep direction so that propagation towards lower indices is not limited to one cell per pass
+        for kk in range(nk):
+            k = kk if forward else nk - 1 - kk
+            for jj in range(nj):
+                j = jj if forward else nj - 1 - jj
+                for ii in range(ni):
+                    i = ii if forward else ni - 1 - ii
                     if bisect[k, j, i]:
                         continue
                     if ((k and bisect[k - 1, j, i] and open_k[k - 1, j, i]) or
@@ -2191,6 +2196,7 @@ def _fill_bisector(bisect: np.ndarray, open_k: np.ndarray, open_j: np.ndarray, o
                         (i < ni - 1 and bisect[k, j, i + 1] and open_i[k, j, i])):
                         bisect[k, j, i] = True
                         going = True
+        forward = not forward
 
 
 @njit  # pragma: no cover
@@ -2199,14 +2205,20 @@ def _fill_packed_bisector(bisect: np.ndarray, open_k: np.ndarray, open_j: np.nda
     nj: int = bisect.shape[1]
     ni: int = bisect.shape[2]
     going: bool = True
+    forward: bool = True
     m: np.uint8 = np.uint8(0)
     om: np.uint8 = np.uint8(0)
     oi: np.uint8 = np.uint8(0)
+    pm: np.uint8 = np.uint8(0)
     while going:
         going = False
-        for k in range(nk):
-            for j in range(nj):
-                for i in range(ni):
+        # alternate sweep direction so that propagation towards lower indices is not limited to one byte per pass
+        for kk in range(nk):
+            k = kk if forward else nk - 1 - kk
+            for jj in range(nj):
+                j = jj if forward else nj - 1 - jj
+                for ii in range(ni):
+                    i = ii if forward else ni - 1 - ii
                     m = np.uint8(bisect[k, j, i])  # 8 bools packed into a uint8
                     if bisect[k, j, i] == np.uint8(0xFF):  # all 8 values already set
                         continue
@@ -2220,16 +2232,21 @@ def _fill_packed_bisector(bisect: np.ndarray, open_k: np.ndarray, open_j: np.nda
                     if j < nj - 1:
                         m |= (bisect[k, j + 1, i] & open_j[k, j, i])
                     oi = np.uint8(open_i[k, j, i])  # type: ignore
-                    m |= (m >> 1) & (oi >> 1)  # type: ignore
-                    m |= (m << 1) & oi  # type: ignore
                     # handle rollover bits for I
                     if i and (bisect[k, j, i - 1] & open_i[k, j, i - 1] & np.uint8(0x01)):
                         m |= np.uint8(0x80)
                     if (i < ni - 1) and (oi & 1) and (bisect[k, j, i + 1] & 0x80):
                         m |= np.uint8(0x01)
+                    # spread within the byte until stable, rather than by one bit per pass
+                    pm = np.uint8(0)
+                    while m != pm:
+                        pm = m
+                        m |= (m >> 1) & (oi >> 1)  # type: ignore
+                        m |= (m << 1) & oi  # type: ignore
                     if m != om:
                         bisect[k, j, i] = m
                         going = True
+        forward = not forward
 
 
 @njit  # pragma: no cover
@@ -5,6 +5,7 @@ import logging
 log = logging.getLogger(__name__)
 
 import copy
+import io
 import os
 import shutil
 import zipfile as zf
@@ -353,7 +354,9 @@ def _store_epc(model, epc_file = None, main_xml_name = '[Content_Types].xml', on
     if model.main_root is None:
         model.main_root = model.main_tree.getroot()
 
-    with zf.ZipFile(epc_file, mode = 'w') as epc:
+    # build the zip in memory and write it out in one go, avoiding a seek back on disk for each part's local header
+    buffer = io.BytesIO()
+    with zf.ZipFile(buffer, mode = 'w') as epc:
         with epc.open(main_xml_name, mode = 'w') as main_xml:
             rqet.write_xml(main_xml, model.main_tree, standalone = 'yes')
         for part_name, (_, _, part_tree) in model.parts_forest.items():
@@ -380,6 +383,8 @@ def _store_epc(model, epc_file = None, main_xml_name = '[Content_Types].xml', on
                 with epc.open(part_name, mode = 'w') as part_xml:
                     rqet.write_xml(part_xml, part_tree, standalone = 'yes')
         # todo: other parts (documentation etc.)
+    with open(epc_file, 'wb') as fp:
+        fp.write(buffer.getbuffer())
     model.set_epc_file_and_directory(epc_file)
     model.modified = False
 
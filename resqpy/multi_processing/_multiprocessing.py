@@ -2,9 +2,11 @@
 
 import logging
 import os
+import shutil
 import time
 import uuid
 import joblib  # type: ignore
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Callable, Union
 from pathlib import Path
 from joblib import Parallel, delayed, parallel_backend  # type: ignore
@@ -14,32 +16,143 @@ import resqpy.olio.consolidation as cons
 
 log = logging.getLogger(__name__)
 
+_scalar_types = (str, bytes, int, float, bool, type(None), uuid.UUID)
+
 
 def rm_tree(path: Union[Path, str]) -> None:
-    """Removes a directory using a pathlib Path.
+    """Removes a directory, together with its contents.
 
     arguments:
         path (Path or str): pathlib Path or string of the directory path
+
+    note:
+        the immediate sub-directories, typically one per multiprocessing instance, are removed concurrently
     """
-    path = Path(path)
     if os.path.isdir(path):
-        for child in path.iterdir():
-            if child.is_file():
-                child.unlink()
-            else:
-                rm_tree(child)
-        path.rmdir()
+        sub_dirs = []
+        # scandir entries carry the file type, avoiding a stat call per child
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks = False):
+                    sub_dirs.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+        if sub_dirs:
+            with ThreadPoolExecutor(max_workers = min(32, len(sub_dirs))) as executor:
+                list(executor.map(shutil.rmtree, sub_dirs))
+        os.rmdir(path)
+
+
+def _shared_values(kwargs_list: List[Dict[str, Any]]) -> List[Any]:
+    """Returns the non-scalar objects which are passed, as the same object, in every kwargs dictionary."""
+    if len(kwargs_list) < 2:
+        return []
+    shared = {id(v): v for v in kwargs_list[0].values() if not isinstance(v, _scalar_types)}
+    for kwargs in kwargs_list[1:]:
+        ids = set(id(v) for v in kwargs.values())
+        shared = {k: v for k, v in shared.items() if k in ids}
+    return list(shared.values())
+
+
+def _results(function: Callable, kwargs_list: List[Dict[str, Any]], cluster, backend: str, batch_size: Union[int, str]):
+    """Yields the result tuples of calling the function with each kwargs, in order of completion."""
+    if cluster is None:
+        for kwargs in kwargs_list:
+            yield function(**kwargs)
+    else:
+        # the multiprocessing backend does not support returning results as a generator
+        return_as = 'list' if backend == 'multiprocessing' else 'generator_unordered'
+        backend_kwargs = {}
+        if backend == 'dask':
+            # broadcast objects shared by all the calls to the workers once, rather than serialising them per call
+            shared = _shared_values(kwargs_list)
+            if shared:
+                backend_kwargs['scatter'] = shared
+        else:
+            # joblib's cpu count respects cpu affinity and container quotas; no point starting more workers than calls
+            backend_kwargs['n_jobs'] = max(1, min(len(kwargs_list), joblib.cpu_count()))
+        with parallel_backend(backend, **backend_kwargs):
+            parallel = Parallel(return_as = return_as, batch_size = batch_size)
+            yield from parallel(delayed(function)(**kwargs) for kwargs in kwargs_list)
+
+
+def _load_instance_model(epc: str):
+    """Returns a Model for a multiprocessing instance epc, waiting for the file to become available."""
+    attempt = 0
+    while not os.path.exists(epc):
+        attempt += 1
+        if attempt == 7:
+            log.warning(f'mp epc slow to materialise: {epc}')
+        if attempt > 300:
+            raise FileNotFoundError(f'timeout waiting for multiprocess worker epc to become available: {epc}')
+        time.sleep(min(attempt, 10))
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return rq.Model(epc_file = epc, quiet = True)
+        except FileNotFoundError:
+            if attempt >= 10:
+                raise FileNotFoundError(f'timeout waiting for mp epc {epc}')
+            time.sleep(1)
+
+
+def _recombine_model(model_recombined, model, uuids: List, consolidate: bool):
+    """Copies the relevant parts from a multiprocessing instance model into the recombined model."""
+    if uuids is None:
+        # take all parts, other than hdf5 external part references, directly from the model's uuid index
+        uuids = [
+            uuid_int for uuid_int, part in model.uuid_part_dict.items()
+            if model.type_of_part(part) != 'obj_EpcExternalPartReference'
+        ]
+    uuids = cons.sort_uuids_list(model, uuids)
+    for u in uuids:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                model_recombined.copy_uuid_from_other_model(model, uuid = u, consolidate = consolidate)
+                break
+            except BlockingIOError:
+                if attempt >= 5:
+                    raise
+            time.sleep(1)
+
+
+def _recombine_arrived(model_recombined, arrived: Dict[int, tuple], loading: Dict[int, Any], loader, next_index: int,
+                       max_loading: int, consolidate: bool, wait: bool) -> int:
+    """Recombines arrived instance results in index order, as far as possible; returns the next index to recombine."""
+    while True:
+        # start loading the epcs of the instances which are due to be recombined soonest
+        for i in range(next_index, next_index + max_loading):
+            if i in arrived and i not in loading and arrived[i][0] is not None:
+                loading[i] = loader.submit(_load_instance_model, arrived[i][0])
+        if next_index not in arrived:
+            return next_index
+        epc, uuids = arrived[next_index]
+        if epc is not None:
+            future = loading[next_index]
+            if not (wait or future.done()):
+                return next_index
+            # log.debug(f'recombining from mp instance {next_index} epc: {epc}')
+            model = future.result()
+            _recombine_model(model_recombined, model, uuids, consolidate)
+            model.h5_release()
+            del loading[next_index]
+        del arrived[next_index]
+        next_index += 1
 
 
 def function_multiprocessing(function: Callable,
                              kwargs_list: List[Dict[str, Any]],
                              recombined_epc: Union[Path, str],
-                             cluster,
+                             cluster = None,
                              consolidate: bool = True,
                              require_success = False,
                              tmp_dir_path: Union[Path, str] = '.',
                              backend: str = 'dask',
-                             clean_up: bool = True) -> List[bool]:
+                             clean_up: bool = True,
+                             batch_size: Union[int, str] = 'auto') -> List[bool]:
     """Calls a function concurrently with the specfied arguments.
 
     arguments:
@@ -47,18 +160,22 @@ def function_multiprocessing(function: Callable,
             - index (int): the index of the kwargs in the kwargs_list;
             - success (bool): whether the function call was successful, however that is defined;
             - epc_file (Path or str): the epc file path where the objects are stored;
-            - uuid_list (list of str): list of UUIDs of relevant objects;
+            - uuid_list (list of str): list of UUIDs of relevant objects; if None, all parts are recombined;
         kwargs_list (list of dict): A list of keyword argument dictionaries that are
             used when calling the function
         recombined_epc (Path or str): A pathlib Path or path string of
             where the combined epc will be saved
-        cluster: if using the Dask backend, a LocalCluster is a Dask cluster on a
+        cluster (optional): if None, the function calls are made serially in this process;
+            if using the Dask backend, a LocalCluster is a Dask cluster on a
             local machine. If using a job queing system, a JobQueueCluster can be used
-            such as an SGECluster, SLURMCluster, PBSCluster, LSFCluster etc
+            such as an SGECluster, SLURMCluster, PBSCluster, LSFCluster etc; no Dask client
+            is created here: the joblib Dask backend uses the caller's current client, which
+            should be created once for the cluster and reused across calls
         consolidate (bool): if True and an equivalent part already exists in
             a model, it is not duplicated and the uuids are noted as equivalent
-        require_success (bool): if True and any instance fails, then an exception is
-            raised
+        require_success (bool): if True and any instance fails, or an instance result is missing
+            or duplicated, then an exception is raised as soon as the problem is encountered and
+            the recombined epc is not stored
         tmp_dir_path (str): path where the temporary directory is saved; defaults to
             the calling code directory
         backend (str): the joblib parallel backend used. Dask is used by default
@@ -66,97 +183,83 @@ def function_multiprocessing(function: Callable,
         clean_up (bool, default True): if True, the temporary directory used during
             multi processing is deleted; if False, it is left in place with its
             contents (to facilitate debugging)
+        batch_size (int or str, default 'auto'): the number of function calls dispatched to a
+            worker at a time by the joblib backend; 'auto' lets joblib adapt the batch size to the
+            duration of the calls; ignored if cluster is None
 
     returns:
-        success_list (List[bool]): A boolean list of successful function calls
+        success_list (List[bool]): A boolean list of successful function calls; an index for which no
+            result, or more than one result, is returned is logged as an error and deemed unsuccessful
 
     notes:
         a multiprocessing pool is used to call the function multiple times in parallel;
-        once all results are returned, they are combined into a single epc file;
+        results are combined into a single epc file as they are returned, in kwargs_list order;
         this function uses the Dask backend by default to run the given function in
         parallel, so a Dask cluster must be setup and passed as an argument if Dask is
         used; Dask will need to be installed in the Python environment because it is not
         a dependency of the project; more info can be found at
-        https://resqpy.readthedocs.io/en/latest/tutorial/multiprocessing.html
+        https://resqpy.readthedocs.io/en/latest/tutorial/multiprocessing.html;
+        to avoid oversubscription by numba compiled functions in Dask workers, set the
+        NUMBA_NUM_THREADS environment variable for the workers when the cluster is created
+        (it is read when numba is first imported); the joblib loky backend already limits
+        the number of threads available to each of its worker processes
     """
     log.info("multiprocessing function called with %s function, %s entries.", function.__name__, len(kwargs_list))
 
     if tmp_dir_path is None:
         tmp_dir_path = '.'
-    tmp_dir = Path(tmp_dir_path) / f'tmp_{uuid.uuid4()}'
+    tmp_dir = os.path.join(tmp_dir_path, f'tmp_{uuid.uuid4()}')  # plain str, shared by all the kwargs
     os.makedirs(tmp_dir)
     for i, kwargs in enumerate(kwargs_list):
         kwargs["index"] = i
-        kwargs["parent_tmp_dir"] = str(tmp_dir)
+        kwargs["parent_tmp_dir"] = tmp_dir
 
-    if cluster is None:
-        results = []
-        for i, kwargs in enumerate(kwargs_list):
-            # log.debug(f'calling function for entry {i}; name: {kwargs.get("name")}')
-            one_r = function(**kwargs)
-            results.append(one_r)
-            # log.debug(f'completed entry: {one_r[0]}; success: {one_r[1]}; epc: {one_r[2]}')
-            # log.debug(f'uuid list: {one_r[3]}')
-    else:
-        with parallel_backend(backend):
-            results = Parallel()(delayed(function)(**kwargs) for kwargs in kwargs_list)
-
-    # Sorting the results by the original kwargs_list index.
-    results = list(sorted(results, key = lambda x: x[0]))
-
-    success_list = [result[1] for result in results]
-    epc_list = [result[2] for result in results]
-    uuids_list = [result[3] for result in results]
-    success_count = sum(success_list)
-    log.info("multiprocessing function calls complete; successes: %s/%s.", success_count, len(results))
-    if require_success and success_count < len(results):
-        raise Exception('one or more multiprocessing instances failed')
-
-    epc_file = Path(str(recombined_epc))
-    if epc_file.is_file():
-        model_recombined = rq.Model(epc_file = str(epc_file), quiet = True)
+    epc_file = os.fspath(recombined_epc)  # Model requires a str path
+    if os.path.isfile(epc_file):
+        model_recombined = rq.Model(epc_file = epc_file, quiet = True)
         log.info(f"updating the recombined epc file: {epc_file}")
     else:
-        model_recombined = rq.new_model(epc_file = str(epc_file))
+        model_recombined = rq.new_model(epc_file = epc_file)
         log.info(f"creating the recombined epc file: {epc_file}")
 
-    model = None
-    for i, epc in enumerate(epc_list):
-        # log.debug(f'recombining from mp instance {i} epc: {epc}')
-        if epc is None:
-            continue
-        attempt = 0
-        while not os.path.exists(epc):
-            attempt += 1
-            if attempt == 7:
-                log.warning(f'mp epc slow to materialise: {epc}')
-            if attempt > 300:
-                raise FileNotFoundError(f'timeout waiting for multiprocess worker epc to become available: {epc}')
-            time.sleep(min(attempt, 10))
-        attempt = 0
-        while True:
-            attempt += 1
-            try:
-                model = rq.Model(epc_file = epc, quiet = True)
-                break
-            except FileNotFoundError:
-                if attempt >= 10:
-                    raise FileNotFoundError(f'timeout waiting for mp epc {epc}')
-                time.sleep(1)
-        uuids = cons.sort_uuids_list(model, uuids_list[i])
-        if uuids is None:
-            uuids = model.uuids()
-        for u in uuids:
-            attempt = 0
-            while True:
-                attempt += 1
-                try:
-                    model_recombined.copy_uuid_from_other_model(model, uuid = u, consolidate = consolidate)
-                    break
-                except BlockingIOError:
-                    if attempt >= 5:
-                        raise
-                time.sleep(1)
+    # results are drained as they complete and recombined incrementally, overlapping recombination with the
+    # remaining calls; instance epcs are loaded in background threads, whilst copying into the recombined model
+    # stays in this thread and follows kwargs_list order, so that consolidation does not depend on timing
+    n = len(kwargs_list)
+    success_list = [False] * n
+    returned = set()  # indices for which a result has been returned
+    max_loading = max(1, min(8, n))
+    arrived = {}  # maps from index to (epc, uuids) for results not yet recombined
+    loading = {}  # maps from index to future for instance model being loaded
+    next_index = 0
+    with ThreadPoolExecutor(max_workers = max_loading) as loader:
+        for index, success, epc, uuids in _results(function, kwargs_list, cluster, backend, batch_size):
+            if index in returned or not 0 <= index < n:
+                log.error(f'unexpected index {index} returned by multiprocessing instance; result ignored')
+                if require_success:
+                    raise Exception('one or more multiprocessing instances returned an unexpected index')
+                if 0 <= index < n:
+                    success_list[index] = False  # duplicated result: the index cannot be trusted
+                continue
+            returned.add(index)
+            success_list[index] = success
+            if not success and require_success:
+                raise Exception('one or more multiprocessing instances failed')
+            arrived[index] = (epc, uuids)
+            next_index = _recombine_arrived(model_recombined, arrived, loading, loader, next_index, max_loading,
+                                            consolidate, False)
+        missing = [i for i in range(n) if i not in returned]
+        if missing:
+            log.error(f'no result returned for multiprocessing instances with indices: {missing}')
+            if require_success:
+                raise Exception('one or more multiprocessing instances did not return a result')
+            for i in missing:
+                arrived[i] = (None, None)  # allows recombination of the later instances to proceed
+        next_index = _recombine_arrived(model_recombined, arrived, loading, loader, next_index, max_loading,
+                                        consolidate, True)
+    assert next_index == n and not arrived, 'multiprocessing results not all recombined'
+
+    log.info("multiprocessing function calls complete; successes: %s/%s.", sum(success_list), n)
 
     # Deleting temporary directory.
     # log.debug(f"deleting the temporary directory {tmp_dir}")
@@ -164,8 +267,6 @@ def function_multiprocessing(function: Callable,
         rm_tree(tmp_dir)
 
     model_recombined.store_epc(quiet = True)
-    if model is not None:
-        model.h5_release()
 
     log.debug(f"recombined epc file complete: {epc_file}")
 
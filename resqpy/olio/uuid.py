@@ -172,6 +172,8 @@ def matching_uuids(uuid_a, uuid_b):
        this function is resilient to uuids being passed in hexadecimal string format, or int
     """
 
+    if type(uuid_a) is uuid.UUID and type(uuid_b) is uuid.UUID:  # fast path for the usual case
+        return uuid_a.int == uuid_b.int
     if isinstance(uuid_a, str):
         uuid_a = uuid_from_string(uuid_a)  # resilience to accidental string arg
     if isinstance(uuid_b, str):
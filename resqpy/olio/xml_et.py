@@ -150,12 +150,12 @@ def find_nested_tags(root, tag_list):
 
     if not tag_list:
         return None
-    head = find_tag(root, tag_list[0])
-    if head is None:
-        return None
-    if len(tag_list) == 1:
-        return head
-    return find_nested_tags(head, tag_list[1:])
+    node = root
+    for tag in tag_list:
+        node = find_tag(node, tag)
+        if node is None:
+            return None
+    return node
 
 
 def find_nested_tags_cast(root, tag_list, dtype = None):
@@ -12,7 +12,7 @@ import resqpy.olio.uuid as bu
 import resqpy.olio.xml_et as rqet
 import resqpy.strata
 import resqpy.strata._strata_common as rqstc
-from resqpy.olio.xml_namespaces import curly_namespace as ns
+from resqpy.strata._strata_common import _RESQML2, _XSI, _XSI_TYPE, _PART_OF_UUID
 
 
 class BinaryContactInterpretation:
@@ -90,7 +90,7 @@ class BinaryContactInterpretation:
         self.index = rqet.find_tag_int(bci_node, 'Index')
         assert self.index is not None, 'missing index in xml for binary contact interpretation'
 
-        self.part_of_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(bci_node, ['PartOf', 'UUID']))
+        self.part_of_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(bci_node, _PART_OF_UUID))
 
         sr_node = rqet.find_tag(bci_node, 'Subject')
         assert sr_node is not None, 'missing subject in xml for binary contact interpretation'
@@ -120,16 +120,16 @@ class BinaryContactInterpretation:
            lxml.etree._Element: the root node of the newly created xml sub-tree for the contact interpretation
         """
 
-        bci = rqet.Element(ns['resqml2'] + 'ContactInterpretation')
-        bci.set(ns['xsi'] + 'type', ns['resqml2'] + 'BinaryContactInterpretationPart')
+        bci = rqet.Element(_RESQML2 + 'ContactInterpretation')
+        bci.set(_XSI_TYPE, _RESQML2 + 'BinaryContactInterpretationPart')
         bci.text = ''
 
-        cr_node = rqet.SubElement(bci, ns['resqml2'] + 'ContactRelationship')
-        cr_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactRelationship')
+        cr_node = rqet.SubElement(bci,
+                                  _RESQML2 + 'ContactRelationship',
+                                  attrib = {_XSI_TYPE: _RESQML2 + 'ContactRelationship'})
         cr_node.text = self.contact_relationship
 
-        i_node = rqet.SubElement(bci, ns['resqml2'] + 'Index')
-        i_node.set(ns['xsi'] + 'type', ns['xsi'] + 'nonNegativeInteger')
+        i_node = rqet.SubElement(bci, _RESQML2 + 'Index', attrib = {_XSI_TYPE: _XSI + 'nonNegativeInteger'})
         i_node.text = str(self.index)
 
         if self.part_of_uuid is not None:
@@ -144,20 +144,19 @@ class BinaryContactInterpretation:
                                               self.direct_object_uuid,
                                               content_type = self.model.type_of_uuid(self.direct_object_uuid),
                                               root = bci)
-        dor_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactElementReference')
+        dor_node.set(_XSI_TYPE, _RESQML2 + 'ContactElementReference')
 
         if self.direct_object_contact_side:
-            doq_node = rqet.SubElement(dor_node, ns['resqml2'] + 'Qualifier')
-            doq_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactSide')
+            doq_node = rqet.SubElement(dor_node, _RESQML2 + 'Qualifier', attrib = {_XSI_TYPE: _RESQML2 + 'ContactSide'})
             doq_node.text = self.direct_object_contact_side
 
         if self.direct_object_contact_mode:
-            dosq_node = rqet.SubElement(dor_node, ns['resqml2'] + 'SecondaryQualifier')
-            dosq_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactMode')
+            dosq_node = rqet.SubElement(dor_node,
+                                        _RESQML2 + 'SecondaryQualifier',
+                                        attrib = {_XSI_TYPE: _RESQML2 + 'ContactMode'})
             dosq_node.text = self.direct_object_contact_mode
 
-        v_node = rqet.SubElement(bci, ns['resqml2'] + 'Verb')
-        v_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactVerb')
+        v_node = rqet.SubElement(bci, _RESQML2 + 'Verb', attrib = {_XSI_TYPE: _RESQML2 + 'ContactVerb'})
         v_node.text = self.verb
 
         sr_node = self.model.create_ref_node('Subject',
@@ -165,16 +164,16 @@ class BinaryContactInterpretation:
                                              self.subject_uuid,
                                              content_type = self.model.type_of_uuid(self.subject_uuid),
                                              root = bci)
-        sr_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactElementReference')
+        sr_node.set(_XSI_TYPE, _RESQML2 + 'ContactElementReference')
 
         if self.subject_contact_side:
-            sq_node = rqet.SubElement(sr_node, ns['resqml2'] + 'Qualifier')
-            sq_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactSide')
+            sq_node = rqet.SubElement(sr_node, _RESQML2 + 'Qualifier', attrib = {_XSI_TYPE: _RESQML2 + 'ContactSide'})
             sq_node.text = self.subject_contact_side
 
         if self.subject_contact_mode:
-            ssq_node = rqet.SubElement(sr_node, ns['resqml2'] + 'SecondaryQualifier')
-            ssq_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'ContactMode')
+            ssq_node = rqet.SubElement(sr_node,
+                                       _RESQML2 + 'SecondaryQualifier',
+                                       attrib = {_XSI_TYPE: _RESQML2 + 'ContactMode'})
             ssq_node.text = self.subject_contact_mode
 
         if parent_node is not None:
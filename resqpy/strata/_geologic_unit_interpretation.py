@@ -12,7 +12,7 @@ import resqpy.organize as rqo
 import resqpy.strata
 import resqpy.strata._strata_common as rqstc
 from resqpy.olio.base import BaseResqpy
-from resqpy.olio.xml_namespaces import curly_namespace as ns
+from resqpy.strata._strata_common import _RESQML2, _XSI_TYPE, _INTERPRETED_FEATURE_UUID
 
 
 class GeologicUnitInterpretation(BaseResqpy):
@@ -73,6 +73,9 @@ class GeologicUnitInterpretation(BaseResqpy):
         self.composition = composition  # optional RESQML item
         self.material_implacement = material_implacement  # optional RESQML item
         super().__init__(model = parent_model, uuid = uuid, title = title, extra_metadata = extra_metadata)
+        if self.root is None:
+            assert self.domain in rqstc.valid_domains,  \
+                f'illegal domain value {self.domain} for geologic unit interpretation'
         if self.composition:
             assert self.composition in rqstc.valid_compositions,  \
                f'invalid composition {self.composition} for geological unit interpretation'
@@ -88,7 +91,7 @@ class GeologicUnitInterpretation(BaseResqpy):
         self.domain = rqet.find_tag_text(root_node, 'Domain')
         # following allows derived StratigraphicUnitInterpretation to instantiate its own interpreted feature
         if self.resqml_type == 'GeologicUnitInterpretation':
-            feature_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(root_node, ['InterpretedFeature', 'UUID']))
+            feature_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(root_node, _INTERPRETED_FEATURE_UUID))
             if feature_uuid is not None:
                 self.geologic_unit_feature = rqo.GeologicUnitFeature(
                     self.model, uuid = feature_uuid, feature_name = self.model.title(uuid = feature_uuid))
@@ -114,6 +117,10 @@ class GeologicUnitInterpretation(BaseResqpy):
             return False
         if self is other or bu.matching_uuids(self.uuid, other.uuid):
             return True
+        # cheap attribute comparisons first, to reject most non-equivalent candidates before any recursion or xml access
+        if (self.composition != other.composition or self.material_implacement != other.material_implacement or
+                self.domain != other.domain):
+            return False
         if self.geologic_unit_feature is not None:
             if not self.geologic_unit_feature.is_equivalent(other.geologic_unit_feature):
                 return False
@@ -126,8 +133,8 @@ class GeologicUnitInterpretation(BaseResqpy):
             return False
         if check_extra_metadata and not rqo.equivalent_extra_metadata(self, other):
             return False
-        return (self.composition == other.composition and self.material_implacement == other.material_implacement and
-                self.domain == other.domain and
+        # inline equality test avoids the helper call in the common case of both pairs being (None, None)
+        return (self.has_occurred_during == other.has_occurred_during or
                 rqo.equivalent_chrono_pairs(self.has_occurred_during, other.has_occurred_during))
 
     def create_xml(self, add_as_part = True, add_relationships = True, originator = None, reuse = True):
@@ -152,37 +159,30 @@ class GeologicUnitInterpretation(BaseResqpy):
             return self.root
         gu = super().create_xml(add_as_part = False, originator = originator)
 
-        assert self.geologic_unit_feature is not None
-        guf_root = self.geologic_unit_feature.root
+        guf = self.geologic_unit_feature
+        guf_root = None if guf is None else guf.root
         assert guf_root is not None, 'interpreted feature not established for geologic unit interpretation'
 
-        assert self.domain in rqstc.valid_domains, 'illegal domain value for geologic unit interpretation'
-        dom_node = rqet.SubElement(gu, ns['resqml2'] + 'Domain')
-        dom_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'Domain')
+        assert self.domain in rqstc.valid_domains, f'illegal domain value {self.domain} for geologic unit interpretation'
+        dom_node = rqet.SubElement(gu, _RESQML2 + 'Domain', attrib = {_XSI_TYPE: _RESQML2 + 'Domain'})
         dom_node.text = self.domain
 
-        self.model.create_ref_node('InterpretedFeature',
-                                   self.geologic_unit_feature.title,
-                                   self.geologic_unit_feature.uuid,
-                                   content_type = self.geologic_unit_feature.resqml_type,
-                                   root = gu)
+        self.model.create_ref_node('InterpretedFeature', guf.title, guf.uuid, content_type = guf.resqml_type, root = gu)
 
         rqo.create_xml_has_occurred_during(self.model, gu, self.has_occurred_during)
 
         if self.composition is not None:
-            assert self.composition in rqstc.valid_compositions,  \
-                f'invalid composition {self.composition} for geologic unit interpretation'
-            comp_node = rqet.SubElement(gu, ns['resqml2'] + 'GeologicUnitComposition')
-            comp_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'GeologicUnitComposition')
+            comp_node = rqet.SubElement(gu,
+                                        _RESQML2 + 'GeologicUnitComposition',
+                                        attrib = {_XSI_TYPE: _RESQML2 + 'GeologicUnitComposition'})
             comp_node.text = self.composition
             if self.composition + ' ' in rqstc.valid_compositions:  # RESQML xsd has spurious trailing space for two compositions
                 comp_node.text += ' '
 
         if self.material_implacement is not None:
-            assert self.material_implacement in rqstc.valid_implacements,  \
-                f'invalid material implacement {self.material_implacement} for geologic unit interpretation'
-            mi_node = rqet.SubElement(gu, ns['resqml2'] + 'GeologicUnitMaterialImplacement')
-            mi_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'GeologicUnitMaterialImplacement')
+            mi_node = rqet.SubElement(gu,
+                                      _RESQML2 + 'GeologicUnitMaterialImplacement',
+                                      attrib = {_XSI_TYPE: _RESQML2 + 'GeologicUnitMaterialImplacement'})
             mi_node.text = self.material_implacement
 
         if add_as_part:
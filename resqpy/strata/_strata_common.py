@@ -1,35 +1,51 @@
 """Common functions and valid xml constant values for stratigraphy related RESQML classes."""
 
+from resqpy.olio.xml_namespaces import curly_namespace as ns
+
+# namespace prefixes for xml tags and attributes, evaluated once
+_RESQML2 = ns['resqml2']
+_EML = ns['eml']
+_XSI = ns['xsi']
+_XSI_TYPE = _XSI + 'type'
+
+# nested tag paths to referenced object uuids, for use with rqet.find_nested_tags_text()
+_INTERPRETED_FEATURE_UUID = ('InterpretedFeature', 'UUID')
+_CHRONO_BOTTOM_UUID = ('ChronostratigraphicBottom', 'UUID')
+_CHRONO_TOP_UUID = ('ChronostratigraphicTop', 'UUID')
+_PART_OF_UUID = ('PartOf', 'UUID')
+_UNIT_UUID = ('Unit', 'UUID')
+
 # note: two compositions have a spurious trailing space in the RESQML xsd; resqpy hides this from calling code
-valid_compositions = [
+valid_compositions = frozenset({
     'intrusive clay ', 'intrusive clay', 'organic', 'intrusive mud ', 'intrusive mud', 'evaporite salt',
     'evaporite non salt', 'sedimentary siliclastic', 'carbonate', 'magmatic intrusive granitoid',
     'magmatic intrusive pyroclastic', 'magmatic extrusive lava flow', 'other chemichal rock', 'sedimentary turbidite'
-]
+})
 
-valid_implacements = ['autochtonous', 'allochtonous']
+valid_implacements = frozenset({'autochtonous', 'allochtonous'})
 
 valid_domains = ('depth', 'time', 'mixed')
 
-valid_deposition_modes = [
-    'proportional between top and bottom', 'parallel to bottom', 'parallel to top', 'parallel to another boundary'
-]
+valid_deposition_modes = frozenset(
+    {'proportional between top and bottom', 'parallel to bottom', 'parallel to top', 'parallel to another boundary'})
 
-valid_ordering_criteria = ['age', 'apparent depth', 'measured depth']  # stratigraphic column must be ordered by age
+# stratigraphic column must be ordered by age
+valid_ordering_criteria = frozenset({'age', 'apparent depth', 'measured depth'})
 
-valid_contact_relationships = [
+valid_contact_relationships = frozenset({
     'frontier feature to frontier feature', 'genetic boundary to frontier feature',
     'genetic boundary to genetic boundary', 'genetic boundary to tectonic boundary',
     'stratigraphic unit to frontier feature', 'stratigraphic unit to stratigraphic unit',
     'tectonic boundary to frontier feature', 'tectonic boundary to genetic boundary',
     'tectonic boundary to tectonic boundary'
-]
+})
 
-valid_contact_verbs = ['splits', 'interrupts', 'contains', 'erodes', 'stops at', 'crosses', 'includes']
+valid_contact_verbs = frozenset({'splits', 'interrupts', 'contains', 'erodes', 'stops at', 'crosses', 'includes'})
 
-valid_contact_sides = ['footwall', 'hanging wall', 'north', 'south', 'east', 'west', 'younger', 'older', 'both']
+valid_contact_sides = frozenset(
+    {'footwall', 'hanging wall', 'north', 'south', 'east', 'west', 'younger', 'older', 'both'})
 
-valid_contact_modes = ['baselap', 'erosion', 'extended', 'proportional']
+valid_contact_modes = frozenset({'baselap', 'erosion', 'extended', 'proportional'})
 
 
 def _index_attr(obj):
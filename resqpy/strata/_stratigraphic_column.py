@@ -50,17 +50,13 @@ class StratigraphicColumn(BaseResqpy):
         super().__init__(model = parent_model, uuid = uuid, title = title, extra_metadata = extra_metadata)
 
         if self.root is None and rank_uuid_list:
-            for rank_uuid in rank_uuid_list:
-                rank = rqscr.StratigraphicColumnRank(self.model, uuid = rank_uuid)
-                self.add_rank(rank)
+            self._set_ranks_from_uuids(rank_uuid_list)
 
     def _load_from_xml(self):
         """Loads class specific attributes from xml for an existing RESQML object; called from BaseResqpy."""
         rank_node_list = rqet.list_of_tag(self.root, 'Ranks')
         assert rank_node_list is not None, 'no stratigraphic column ranks in xml for stratigraphic column'
-        for rank_node in rank_node_list:
-            rank = rqscr.StratigraphicColumnRank(self.model, uuid = rqet.find_tag_text(rank_node, 'UUID'))
-            self.add_rank(rank)
+        self._set_ranks_from_uuids([rqet.find_tag_text(rank_node, 'UUID') for rank_node in rank_node_list])
 
     def iter_ranks(self):
         """Yields the stratigraphic column ranks which constitute this stratigraphic colunn."""
@@ -82,6 +78,12 @@ class StratigraphicColumn(BaseResqpy):
         self.ranks.append(rank)
         self._sort_ranks()
 
+    def _set_ranks_from_uuids(self, rank_uuid_list):
+        """Sets the list of ranks from existing stratigraphic column ranks, sorting once by their index values."""
+        self.ranks = [rqscr.StratigraphicColumnRank(self.model, uuid = rank_uuid) for rank_uuid in rank_uuid_list]
+        assert all(rank.index is not None for rank in self.ranks)
+        self._sort_ranks()
+
     def _sort_ranks(self):
         """Sort the list of ranks, in situ, by their index values."""
         self.ranks.sort(key = rqstc._index_attr)
@@ -105,7 +107,7 @@ class StratigraphicColumn(BaseResqpy):
         if len(self.ranks) != len(other.ranks):
             return False
         for rank_a, rank_b in zip(self.ranks, other.ranks):
-            if rank_a != rank_b:
+            if not bu.matching_uuids(rank_a.uuid, rank_b.uuid):
                 return False
         if check_extra_metadata and not rqo.equivalent_extra_metadata(self, other):
             return False
@@ -133,8 +135,6 @@ class StratigraphicColumn(BaseResqpy):
 
         sci = super().create_xml(add_as_part = False, originator = originator)
 
-        assert sci is not None
-
         for rank in self.ranks:
             self.model.create_ref_node('Ranks',
                                        rank.title,
@@ -15,7 +15,7 @@ import resqpy.strata._strata_common as rqstc
 import resqpy.strata._binary_contact_interpretation as rqsbc
 import resqpy.strata._stratigraphic_unit_interpretation as rqsui
 from resqpy.olio.base import BaseResqpy
-from resqpy.olio.xml_namespaces import curly_namespace as ns
+from resqpy.strata._strata_common import _RESQML2, _XSI, _XSI_TYPE, _INTERPRETED_FEATURE_UUID, _UNIT_UUID
 
 
 class StratigraphicColumnRank(BaseResqpy):
@@ -76,13 +76,13 @@ class StratigraphicColumnRank(BaseResqpy):
         assert rqet.find_tag_text(root_node, 'OrderingCriteria') == 'age',  \
            'stratigraphic column rank interpretation ordering criterion must be age'
         self.domain = rqet.find_tag_text(root_node, 'Domain')
-        self.feature_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(root_node, ['InterpretedFeature', 'UUID']))
+        self.feature_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(root_node, _INTERPRETED_FEATURE_UUID))
         self.has_occurred_during = rqo.extract_has_occurred_during(root_node)
         self.index = rqet.find_tag_int(root_node, 'Index')
         self.units = []
         for su_node in rqet.list_of_tag(root_node, 'StratigraphicUnits'):
             index = rqet.find_tag_int(su_node, 'Index')
-            unit_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(su_node, ['Unit', 'UUID']))
+            unit_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(su_node, _UNIT_UUID))
             assert index is not None and unit_uuid is not None
             assert self.model.type_of_uuid(unit_uuid, strip_obj = True) == 'StratigraphicUnitInterpretation'
             self.units.append((index, rqsui.StratigraphicUnitInterpretation(self.model, uuid = unit_uuid)))
@@ -210,28 +210,27 @@ class StratigraphicColumnRank(BaseResqpy):
                                    root = scri)
 
         assert self.domain in rqstc.valid_domains, 'illegal domain value for stratigraphic column rank interpretation'
-        dom_node = rqet.SubElement(scri, ns['resqml2'] + 'Domain')
-        dom_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'Domain')
+        dom_node = rqet.SubElement(scri, _RESQML2 + 'Domain', attrib = {_XSI_TYPE: _RESQML2 + 'Domain'})
         dom_node.text = self.domain
 
         rqo.create_xml_has_occurred_during(self.model, scri, self.has_occurred_during)
 
-        oc_node = rqet.SubElement(scri, ns['resqml2'] + 'OrderingCriteria')
-        oc_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'OrderingCriteria')
+        oc_node = rqet.SubElement(scri,
+                                  _RESQML2 + 'OrderingCriteria',
+                                  attrib = {_XSI_TYPE: _RESQML2 + 'OrderingCriteria'})
         oc_node.text = 'age'
 
-        i_node = rqet.SubElement(scri, ns['resqml2'] + 'Index')
-        i_node.set(ns['xsi'] + 'type', ns['xsi'] + 'nonNegativeInteger')
+        i_node = rqet.SubElement(scri, _RESQML2 + 'Index', attrib = {_XSI_TYPE: _XSI + 'nonNegativeInteger'})
         i_node.text = str(self.index)
 
         for i, unit in self.units:
 
-            su_node = rqet.SubElement(scri, ns['resqml2'] + 'StratigraphicUnits')
-            su_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'StratigraphicUnitInterpretationIndex')
+            su_node = rqet.SubElement(scri,
+                                      _RESQML2 + 'StratigraphicUnits',
+                                      attrib = {_XSI_TYPE: _RESQML2 + 'StratigraphicUnitInterpretationIndex'})
             su_node.text = ''
 
-            si_node = rqet.SubElement(su_node, ns['resqml2'] + 'Index')
-            si_node.set(ns['xsi'] + 'type', ns['xsi'] + 'nonNegativeInteger')
+            si_node = rqet.SubElement(su_node, _RESQML2 + 'Index', attrib = {_XSI_TYPE: _XSI + 'nonNegativeInteger'})
             si_node.text = str(i)
 
             self.model.create_ref_node('Unit',
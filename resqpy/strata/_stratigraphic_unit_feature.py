@@ -10,6 +10,7 @@ import resqpy.olio.uuid as bu
 import resqpy.olio.xml_et as rqet
 import resqpy.organize as rqo
 from resqpy.olio.base import BaseResqpy
+from resqpy.strata._strata_common import _CHRONO_BOTTOM_UUID, _CHRONO_TOP_UUID
 
 
 class StratigraphicUnitFeature(BaseResqpy):
@@ -85,8 +86,8 @@ class StratigraphicUnitFeature(BaseResqpy):
         """Loads class specific attributes from xml for an existing RESQML object; called from BaseResqpy."""
         root_node = self.root
         assert root_node is not None
-        bottom_ref_uuid = rqet.find_nested_tags_text(root_node, ['ChronostratigraphicBottom', 'UUID'])
-        top_ref_uuid = rqet.find_nested_tags_text(root_node, ['ChronostratigraphicTop', 'UUID'])
+        bottom_ref_uuid = rqet.find_nested_tags_text(root_node, _CHRONO_BOTTOM_UUID)
+        top_ref_uuid = rqet.find_nested_tags_text(root_node, _CHRONO_TOP_UUID)
         # todo: find out if these are meant to be references to other stratigraphic unit features or geologic unit features
         # and if so, instantiate those objects?
         # for now, simply note the uuids
@@ -115,30 +116,43 @@ class StratigraphicUnitFeature(BaseResqpy):
         # create node with citation block
         suf = super().create_xml(add_as_part = False, originator = originator)
 
+        bottom_root = top_root = None
+        same_unit = (self.bottom_unit_uuid is not None and self.top_unit_uuid is not None and
+                     bu.matching_uuids(self.bottom_unit_uuid, self.top_unit_uuid))
+
         if self.bottom_unit_uuid is not None:
+            bottom_root, bottom_title, bottom_type = _part_details(self.model, self.bottom_unit_uuid)
             self.model.create_ref_node('ChronostratigraphicBottom',
-                                       self.model.title(uuid = self.bottom_unit_uuid),
+                                       bottom_title,
                                        self.bottom_unit_uuid,
-                                       content_type = self.model.type_of_uuid(self.bottom_unit_uuid),
+                                       content_type = bottom_type,
                                        root = suf)
 
         if self.top_unit_uuid is not None:
+            if same_unit:
+                top_root, top_title, top_type = bottom_root, bottom_title, bottom_type
+            else:
+                top_root, top_title, top_type = _part_details(self.model, self.top_unit_uuid)
             self.model.create_ref_node('ChronostratigraphicTop',
-                                       self.model.title(uuid = self.top_unit_uuid),
+                                       top_title,
                                        self.top_unit_uuid,
-                                       content_type = self.model.type_of_uuid(self.top_unit_uuid),
+                                       content_type = top_type,
                                        root = suf)
 
         if add_as_part:
             self.model.add_part('obj_StratigraphicUnitFeature', self.uuid, suf)
             if add_relationships:
                 if self.bottom_unit_uuid is not None:
-                    self.model.create_reciprocal_relationship(suf, 'destinationObject',
-                                                              self.model.root(uuid = self.bottom_unit_uuid),
-                                                              'sourceObject')
-                if self.top_unit_uuid is not None and not bu.matching_uuids(self.bottom_unit_uuid, self.top_unit_uuid):
-                    self.model.create_reciprocal_relationship(suf, 'destinationObject',
-                                                              self.model.root(uuid = self.top_unit_uuid),
-                                                              'sourceObject')
+                    self.model.create_reciprocal_relationship(suf, 'destinationObject', bottom_root, 'sourceObject')
+                if self.top_unit_uuid is not None and not same_unit:
+                    self.model.create_reciprocal_relationship(suf, 'destinationObject', top_root, 'sourceObject')
 
         return suf
+
+
+def _part_details(model, uuid):
+    """Returns (root, title, content type) for the part with given uuid, using a single part lookup."""
+    part = model.part_for_uuid(uuid)
+    if part is None:
+        return None, None, None
+    return model.root_for_part(part), model.title_for_part(part), model.type_of_part(part)
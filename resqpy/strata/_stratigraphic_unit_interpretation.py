@@ -13,7 +13,7 @@ import resqpy.strata._strata_common as rqstc
 import resqpy.strata._geologic_unit_interpretation as rqsgui
 import resqpy.strata._stratigraphic_unit_feature as rqsui
 import resqpy.weights_and_measures as wam
-from resqpy.olio.xml_namespaces import curly_namespace as ns
+from resqpy.strata._strata_common import _RESQML2, _EML, _XSI_TYPE, _INTERPRETED_FEATURE_UUID
 
 
 class StratigraphicUnitInterpretation(rqsgui.GeologicUnitInterpretation):
@@ -105,26 +105,28 @@ class StratigraphicUnitInterpretation(rqsgui.GeologicUnitInterpretation):
         super()._load_from_xml()
         root_node = self.root
         assert root_node is not None
-        feature_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(root_node, ['InterpretedFeature', 'UUID']))
+        feature_uuid = bu.uuid_from_string(rqet.find_nested_tags_text(root_node, _INTERPRETED_FEATURE_UUID))
         if feature_uuid is not None:
             self.geologic_unit_feature = rqsui.StratigraphicUnitFeature(self.model,
                                                                         uuid = feature_uuid,
                                                                         title = self.model.title(uuid = feature_uuid))
-        # load deposition mode and min & max thicknesses (& uom), if present
-        self.deposition_mode = rqet.find_tag_text(root_node, 'DepositionMode')
-        for min_max in ['Min', 'Max']:
-            thick_node = rqet.find_tag(root_node, min_max + 'Thickness')
-            if thick_node is not None:
-                thick = float(thick_node.text)
-                if min_max == 'Min':
-                    self.min_thickness = thick
-                else:
-                    self.max_thickness = thick
-                thick_uom = thick_node.attrib['uom']  # todo: check this is correct uom representation
-                if self.thickness_uom is None:
-                    self.thickness_uom = thick_uom
-                else:
-                    assert thick_uom == self.thickness_uom, 'inconsistent length units of measure for stratigraphic thicknesses'
+        # load deposition mode and min & max thicknesses (& uom), if present, from a single pass over the children
+        child_nodes = {}
+        for child in root_node:
+            child_nodes.setdefault(rqet.stripped_of_prefix(child.tag), child)
+        self.deposition_mode = rqet.node_text(child_nodes.get('DepositionMode'))
+        min_thick_node = child_nodes.get('MinThickness')
+        max_thick_node = child_nodes.get('MaxThickness')
+        if min_thick_node is not None:
+            self.min_thickness = float(min_thick_node.text)
+        if max_thick_node is not None:
+            self.max_thickness = float(max_thick_node.text)
+        thick_uoms = set(node.attrib['uom'] for node in (min_thick_node, max_thick_node) if node is not None)
+        if self.thickness_uom is not None:
+            thick_uoms.add(self.thickness_uom)
+        assert len(thick_uoms) <= 1, 'inconsistent length units of measure for stratigraphic thicknesses'
+        if thick_uoms:
+            self.thickness_uom = thick_uoms.pop()
 
     def is_equivalent(self, other, check_extra_metadata = True):
         """Returns True if this interpretation is essentially the same as the other; otherwise False.
@@ -166,28 +168,32 @@ class StratigraphicUnitInterpretation(rqsgui.GeologicUnitInterpretation):
                                  add_relationships = add_relationships,
                                  originator = originator,
                                  reuse = False)
-        assert sui is not None
 
         if self.deposition_mode is not None:
-            assert self.deposition_mode in rqstc.valid_deposition_modes,  \
-                f'invalid deposition mode {self.deposition_mode} for stratigraphic unit interpretation'
-            dm_node = rqet.SubElement(sui, ns['resqml2'] + 'DepositionMode')
-            dm_node.set(ns['xsi'] + 'type', ns['resqml2'] + 'DepositionMode')
+            dm_node = rqet.SubElement(sui,
+                                      _RESQML2 + 'DepositionMode',
+                                      attrib = {_XSI_TYPE: _RESQML2 + 'DepositionMode'})
             dm_node.text = self.deposition_mode
 
         if self.min_thickness is not None or self.max_thickness is not None:
-            assert self.thickness_uom in wam.valid_uoms(quantity = 'length')
+            assert self.thickness_uom is not None, 'thickness uom missing for stratigraphic unit interpretation'
 
         if self.min_thickness is not None:
-            min_thick_node = rqet.SubElement(sui, ns['resqml2'] + 'MinThickness')
-            min_thick_node.set(ns['xsi'] + 'type', ns['eml'] + 'LengthMeasure')
-            min_thick_node.set('uom', self.thickness_uom)  # todo: check this
+            min_thick_node = rqet.SubElement(sui,
+                                             _RESQML2 + 'MinThickness',
+                                             attrib = {
+                                                 _XSI_TYPE: _EML + 'LengthMeasure',
+                                                 'uom': self.thickness_uom
+                                             })
             min_thick_node.text = str(self.min_thickness)
 
         if self.max_thickness is not None:
-            max_thick_node = rqet.SubElement(sui, ns['resqml2'] + 'MaxThickness')
-            max_thick_node.set(ns['xsi'] + 'type', ns['eml'] + 'LengthMeasure')
-            max_thick_node.set('uom', self.thickness_uom)
+            max_thick_node = rqet.SubElement(sui,
+                                             _RESQML2 + 'MaxThickness',
+                                             attrib = {
+                                                 _XSI_TYPE: _EML + 'LengthMeasure',
+                                                 'uom': self.thickness_uom
+                                             })
             max_thick_node.text = str(self.max_thickness)
 
         return sui
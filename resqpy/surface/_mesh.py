@@ -48,7 +48,8 @@ class Mesh(rqsb.BaseSurface):
                  crs_uuid = None,
                  title = None,
                  originator = None,
-                 extra_metadata = None):
+                 extra_metadata = None,
+                 copy_xyz_values = True):
         """Initialises a Mesh object from xml, or a regular mesh from arguments.
 
         arguments:
@@ -81,6 +82,8 @@ class Mesh(rqsb.BaseSurface):
               ignored if uuid is not None
            extra_metadata (dict, optional): string key, value pairs to add as extra metadata for the mesh;
               ignored if uuid is not None
+           copy_xyz_values (bool, default True): if False, the xyz_values array is held as the full array of
+              the mesh without taking a copy, so it must not be modified by the calling code afterwards
 
         returns:
            the newly created Mesh object
@@ -133,7 +136,7 @@ class Mesh(rqsb.BaseSurface):
             self.__load_from_mesh_file(mesh_file, mesh_flavour, mesh_format, crs_uuid, ni, nj)
 
         elif xyz_values is not None and crs_uuid is not None:
-            self.__load_from_xyz_values(xyz_values)
+            self.__load_from_xyz_values(xyz_values, copy_xyz_values)
 
         else:
             self.__load_from_arguments(ni, nj, origin, dxyz_dij, z_values, z_supporting_mesh_uuid, crs_uuid)
@@ -378,13 +381,13 @@ class Mesh(rqsb.BaseSurface):
         self.regular_dxyz_dij = np.array(dxyz_dij, dtype = float)
         assert self.crs_uuid is not None, 'crs uuid missing'
 
-    def __load_from_xyz_values(self, xyz_values):
+    def __load_from_xyz_values(self, xyz_values, copy_xyz_values):
         # create an explicit mesh directly from a numpy array of points
         assert xyz_values.ndim == 3 and xyz_values.shape[2] == 3 and xyz_values.shape[0] > 1 and xyz_values.shape[1] > 1
         self.flavour = 'explicit'
         self.nj = xyz_values.shape[0]
         self.ni = xyz_values.shape[1]
-        self.full_array = xyz_values.copy()
+        self.full_array = xyz_values.copy() if copy_xyz_values else xyz_values
         assert self.crs_uuid is not None, 'crs uuid missing'
 
     def __load_from_mesh_file(self, mesh_file, mesh_flavour, mesh_format, crs_uuid, ni, nj):
@@ -39,7 +39,8 @@ class PointSet(rqsb.BaseSurface):
                  title = None,
                  originator = None,
                  extra_metadata = None,
-                 remove_trailing_999 = True):
+                 remove_trailing_999 = True,
+                 copy_points_array = True):
         """Creates an empty Point Set object and optionally populates from xml or other source.
 
         arguments:
@@ -69,6 +70,8 @@ class PointSet(rqsb.BaseSurface):
               ignored if uuid is not None
            remove_trailing_999 (bool, default True): if True, when loading from an irap_file, if the last point
               in the file is triple 999.0, then it is excluded from the point set
+           copy_points_array (bool, default True): if False, a points_array which already has xyz values is held
+              without taking a copy, so it must not be modified by the calling code afterwards
 
         returns:
            newly created PointSet object
@@ -95,7 +98,7 @@ class PointSet(rqsb.BaseSurface):
 
         elif points_array is not None:
             assert self.crs_uuid is not None, 'missing crs uuid when establishing point set from array'
-            self.add_patch(points_array)
+            self.add_patch(points_array, copy = copy_points_array)
 
         elif polyline is not None:  # Points from or within polyline
             self.from_polyline(polyline, random_point_count)
@@ -391,8 +394,15 @@ class PointSet(rqsb.BaseSurface):
         assert full_index == point_count, 'point count mismatch when constructing full array for point set'
         return self.full_array
 
-    def add_patch(self, points_array):
-        """Extend the current point set with a new patch of points."""
+    def add_patch(self, points_array, copy = True):
+        """Extend the current point set with a new patch of points.
+
+        arguments:
+           points_array (numpy float array of shape (..., 2 or 3)): the xy(&z) data for the new patch; missing z
+              will be set to zero
+           copy (bool, default True): if False, an xyz points_array is held without taking a copy, so it must not
+              be modified by the calling code afterwards; an xy points_array is always copied
+        """
 
         assert points_array.ndim >= 2 and points_array.shape[-1] in [2, 3]
         if points_array.shape[-1] == 2:
@@ -401,7 +411,9 @@ class PointSet(rqsb.BaseSurface):
             p = np.zeros(shape)
             p[..., :2] = points_array
             points_array = p
-        self.patch_array_list.append(points_array.reshape(-1, 3).copy())
+            copy = False  # already a new array
+        points_array = points_array.reshape(-1, 3)
+        self.patch_array_list.append(points_array.copy() if copy else points_array)
         self.patch_ref_list.append((None, None, points_array.size // 3))
         self.full_array = None
         if self.patch_count is None:
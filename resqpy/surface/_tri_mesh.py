@@ -87,7 +87,7 @@ class TriMesh(rqs.Mesh):
                 if np.isnan(o_a[2]):
                     o_a[2] = 0.0
                 assert not np.any(np.isnan(o_a))
-                xyz += np.expand_dims(np.expand_dims(o_a, axis = 0), axis = 0)
+                xyz += o_a  # broadcast over nj, ni
                 o_a[2] = 0.0  # origin z included in explicit values and moved to zero
             super().__init__(parent_model,
                              mesh_flavour = 'explicit',
@@ -98,7 +98,8 @@ class TriMesh(rqs.Mesh):
                              crs_uuid = crs_uuid,
                              title = title,
                              originator = originator,
-                             extra_metadata = extra_metadata)
+                             extra_metadata = extra_metadata,
+                             copy_xyz_values = False)
             self.t_side = t_side
             self.origin = o_a
             self.z_uom = z_uom
@@ -121,7 +122,7 @@ class TriMesh(rqs.Mesh):
                 self.origin = None
             else:
                 self.origin = origin
-        self.t_type = np.int32 if self.is_big() else np.int64
+        self.t_type = np.int64 if self.is_big() else np.int32
 
     @classmethod
     def from_tri_mesh_and_z_values(cls,
@@ -380,6 +381,30 @@ class TriMesh(rqs.Mesh):
         assert 0 <= tj < self.nj - 1 and 0 <= ti < 2 * (self.ni - 1)
         return 2 * (self.ni - 1) * tj + ti
 
+    def tji_for_triangle_index_array(self, ti_array):
+        """Return array of triangle tji (tj, ti), shape (..., 2), for triangle indices in Surface protocol.
+
+        note:
+            returned values are -1 where a triangle index is out of range
+        """
+        ti_array = np.asarray(ti_array)
+        tji = np.stack(np.divmod(ti_array, 2 * (self.ni - 1)), axis = -1)
+        tji[np.logical_or(ti_array < 0, ti_array >= (self.nj - 1) * (self.ni - 1) * 2)] = -1
+        return tji
+
+    def triangle_index_for_tji_array(self, tji_array):
+        """Return array of triangle indices in Surface protocol for triangles tji_array (..., 2) being (tj, ti).
+
+        note:
+            returned values are -1 where a tji is out of range
+        """
+        tji_array = np.asarray(tji_array)
+        tj = tji_array[..., 0]
+        ti = tji_array[..., 1]
+        t_index = 2 * (self.ni - 1) * tj + ti
+        mask = np.logical_or(np.logical_or(tj < 0, tj >= self.nj - 1), np.logical_or(ti < 0, ti >= 2 * (self.ni - 1)))
+        return np.where(mask, -1, t_index)
+
     def tri_nodes_in_triangles(self, triangles):
         """Return indices of nodes of this tri mesh which are within other triangles, in xy space.
 
@@ -397,7 +422,7 @@ class TriMesh(rqs.Mesh):
 
         tp = triangles.copy()
         if self.origin is not None:
-            tp[:] -= np.expand_dims(np.expand_dims(self.origin[:2], axis = 0), axis = 0)
+            tp -= self.origin[:2]
 
         # test odd node j rows of tri mesh points; note that vec function assumes a half 'cell' offset!
         tn_b = vec.points_in_triangles_aligned_optimised(self.ni, self.nj // 2, self.t_side,
@@ -407,7 +432,7 @@ class TriMesh(rqs.Mesh):
 
         # shift other triangles' points so as to compensate for half cell offset, for even j node rows
         offset = np.array((0.5, root_3_by_2), dtype = float) * self.t_side
-        tp[:] += np.expand_dims(np.expand_dims(offset, axis = 0), axis = 0)
+        tp += offset
 
         # test even node j rows of tri mesh points
         tn_a = vec.points_in_triangles_aligned_optimised(self.ni, (self.nj + 1) // 2, self.t_side, root_3 * self.t_side,
@@ -65,16 +65,13 @@ def example_model_and_mixed_units_crs(tmp_model):
     return tmp_model, crs
 
 
-@pytest.fixture
-def example_model_with_well(example_model_and_crs):
-    """ Model with a single well with a vertical trajectory """
+def _model_with_well(model: Model, crs: Crs):
+    """Adds a single well with a vertical trajectory to a model."""
 
     wellname = 'well A'
     elevation = 100
     md_uom = 'm'
 
-    model, crs = example_model_and_crs
-
     # Create a single well feature and interpretation
     well_feature = WellboreFeature(parent_model = model, feature_name = wellname)
     well_feature.create_xml()
@@ -102,6 +99,23 @@ def example_model_with_well(example_model_and_crs):
     return model, well_interp, datum, traj
 
 
+@pytest.fixture
+def example_model_with_well(example_model_and_crs):
+    """ Model with a single well with a vertical trajectory """
+
+    return _model_with_well(*example_model_and_crs)
+
+
+@pytest.fixture(scope = 'module')
+def shared_model_with_well(tmp_path_factory):
+    """Model with a single well with a vertical trajectory, created once per module and shared by its tests."""
+
+    model = new_model(str(tmp_path_factory.mktemp('shared') / 'shared_well_model.epc'))
+    crs = Crs(parent_model = model, z_inc_down = True, xy_units = 'm', z_units = 'm')
+    crs.create_xml()
+    return _model_with_well(model, crs)
+
+
 @pytest.fixture
 def example_model_with_logs(example_model_with_well):
     model, well_interp, datum, traj = example_model_with_well
@@ -494,29 +508,32 @@ def example_fine_coarse_model(example_model_and_crs):
 @pytest.fixture
 def small_grid_and_surface(tmp_model: Model) -> Tuple[grr.RegularGrid, rqs.Surface]:
     """Creates a small RegularGrid and a random triangular surface."""
-    crs = Crs(tmp_model)
-    crs.create_xml()
-
-    extent = 10
-    extent_kji = (extent, extent, extent)
-    dxyz = (1.0, 1.0, 1.0)
-    crs_uuid = crs.uuid
-    title = "small_grid"
-    grid = grr.RegularGrid(tmp_model, extent_kji = extent_kji, dxyz = dxyz, crs_uuid = crs_uuid, title = title)
-    grid.create_xml()
-
-    n_points = 100
-    points = np.random.rand(n_points, 3) * extent
-    triangles = tri.dt(points)
-    surface = rqs.Surface(tmp_model, crs_uuid = crs_uuid, title = "small_surface")
-    surface.set_from_triangles_and_points(triangles, points)
-    surface.triangles_and_points()
-    surface.write_hdf5()
-    surface.create_xml()
-
-    tmp_model.store_epc()
-
-    return grid, surface
+    return _small_grid_and_surface(tmp_model)
+
+
+@pytest.fixture(scope = 'session')
+def shared_small_grid_and_surface(tmp_path_factory) -> Tuple[grr.RegularGrid, rqs.Surface]:
+    """Creates a small RegularGrid and a random triangular surface once per session; tests must not modify them."""
+    return _small_grid_and_surface(new_model(str(tmp_path_factory.mktemp('shared') / 'shared_model.epc')))
+
+
+@pytest.fixture(scope = 'session')
+def shared_point_set(shared_small_grid_and_surface, tmp_path_factory) -> rqs.PointSet:
+    """Creates a PointSet of the shared small surface's points, in a model of its own, once per session."""
+    _, surface = shared_small_grid_and_surface
+    model = new_model(str(tmp_path_factory.mktemp('shared') / 'shared_point_set.epc'))
+    model.copy_uuid_from_other_model(surface.model, surface.crs_uuid)
+    _, p = surface.triangles_and_points()
+    # the point set holds the shared surface's points array itself, without a copy
+    ps = rqs.PointSet(model,
+                      points_array = p,
+                      crs_uuid = surface.crs_uuid,
+                      title = surface.title,
+                      copy_points_array = False)
+    ps.write_hdf5()
+    ps.create_xml()
+    model.store_epc()
+    return ps
 
 
 @pytest.fixture
@@ -691,36 +708,14 @@ def small_grid_and_surface_no_i(tmp_model: Model) -> Tuple[grr.RegularGrid, rqs.
 @pytest.fixture
 def small_grid_and_extended_surface(tmp_model: Model) -> Tuple[grr.RegularGrid, rqs.Surface]:
     """Creates a small RegularGrid and a random triangular surface extended with a flange."""
-    crs = Crs(tmp_model)
-    crs.create_xml()
-
-    extent = 10
-    extent_kji = (extent, extent + 1, extent + 2)
-    dxyz = (1.0, 1.0, 1.0)
-    crs_uuid = crs.uuid
-    title = "small_grid"
-    grid = grr.RegularGrid(tmp_model, extent_kji = extent_kji, dxyz = dxyz, crs_uuid = crs_uuid, title = title)
-    grid.create_xml()
-
-    n_points = 100
-    points = np.random.rand(n_points, 3) * extent
-    surface = rqs.Surface(tmp_model, crs_uuid = crs_uuid, title = "small_surface")
-    ps = rqs.PointSet(tmp_model, points_array = points, crs_uuid = crs_uuid, title = 'temp point set')
-    surface.set_from_point_set(ps,
-                               convexity_parameter = 0.05,
-                               reorient = True,
-                               extend_with_flange = True,
-                               flange_point_count = 11,
-                               flange_radial_factor = 10.0,
-                               flange_radial_distance = None,
-                               make_clockwise = False)
-    surface.triangles_and_points()
-    surface.write_hdf5()
-    surface.create_xml()
+    return _small_grid_and_extended_surface(tmp_model)
 
-    tmp_model.store_epc()
 
-    return grid, surface
+@pytest.fixture(scope = 'session')
+def shared_small_grid_and_extended_surface(tmp_path_factory) -> Tuple[grr.RegularGrid, rqs.Surface]:
+    """Creates a small RegularGrid and an extended random surface once per session; tests must not modify them."""
+    return _small_grid_and_extended_surface(
+        new_model(str(tmp_path_factory.mktemp('shared') / 'shared_extended_model.epc')))
 
 
 @pytest.fixture
@@ -758,10 +753,11 @@ def small_grid_with_properties(tmp_model: Model) -> Tuple[grr.RegularGrid, List[
     return grid, prop_uuids
 
 
-@pytest.fixture
-def small_grid_and_surface_nonrandom(tmp_model: Model) -> Tuple[grr.RegularGrid, rqs.Surface]:
-    """Creates a small RegularGrid and a random triangular surface."""
-    crs = Crs(tmp_model)
+@pytest.fixture(scope = 'session')
+def small_grid_and_surface_nonrandom(tmp_path_factory) -> Tuple[grr.RegularGrid, rqs.Surface]:
+    """Creates a small RegularGrid and a fixed triangular surface once per session; tests must not modify them."""
+    model = new_model(str(tmp_path_factory.mktemp('shared') / 'nonrandom_model.epc'))
+    crs = Crs(model)
     crs.create_xml()
 
     extent = 10
@@ -769,7 +765,7 @@ def small_grid_and_surface_nonrandom(tmp_model: Model) -> Tuple[grr.RegularGrid,
     dxyz = (1.0, 1.0, 1.0)
     crs_uuid = crs.uuid
     title = "small_grid"
-    grid = grr.RegularGrid(tmp_model, extent_kji = extent_kji, dxyz = dxyz, crs_uuid = crs_uuid, title = title)
+    grid = grr.RegularGrid(model, extent_kji = extent_kji, dxyz = dxyz, crs_uuid = crs_uuid, title = title)
     grid.create_xml()
 
     points = np.array([[0.08106761, 1.3295167, 0.11162371], [1.12741581, 2.38222333, 0.68750453],
@@ -779,12 +775,73 @@ def small_grid_and_surface_nonrandom(tmp_model: Model) -> Tuple[grr.RegularGrid,
                        [0.90551676, 1.15075557, 1.94205026], [0.84642013, 0.22261785, 1.59408085],
                        [1.72919692, 2.34885194, 1.01135179]])
     triangles = tri.dt(points)
-    surface = rqs.Surface(tmp_model, crs_uuid = crs_uuid, title = "small_surface")
+    surface = rqs.Surface(model, crs_uuid = crs_uuid, title = "small_surface")
     surface.set_from_triangles_and_points(triangles, points)
     surface.triangles_and_points()
     surface.write_hdf5()
     surface.create_xml()
 
-    tmp_model.store_epc()
+    model.store_epc()
+
+    return grid, surface
+
+
+def _small_grid_and_surface(model: Model) -> Tuple[grr.RegularGrid, rqs.Surface]:
+    """Creates a small RegularGrid and a random triangular surface in the given model, and stores the epc."""
+    crs = Crs(model)
+    crs.create_xml()
+
+    extent = 10
+    extent_kji = (extent, extent, extent)
+    dxyz = (1.0, 1.0, 1.0)
+    crs_uuid = crs.uuid
+    title = "small_grid"
+    grid = grr.RegularGrid(model, extent_kji = extent_kji, dxyz = dxyz, crs_uuid = crs_uuid, title = title)
+    grid.create_xml()
+
+    n_points = 100
+    points = np.random.rand(n_points, 3) * extent
+    triangles = tri.dt(points)
+    surface = rqs.Surface(model, crs_uuid = crs_uuid, title = "small_surface")
+    surface.set_from_triangles_and_points(triangles, points)
+    surface.triangles_and_points()
+    surface.write_hdf5()
+    surface.create_xml()
+
+    model.store_epc()
+
+    return grid, surface
+
+
+def _small_grid_and_extended_surface(model: Model) -> Tuple[grr.RegularGrid, rqs.Surface]:
+    """Creates a small RegularGrid and a random surface extended with a flange in the given model; stores the epc."""
+    crs = Crs(model)
+    crs.create_xml()
+
+    extent = 10
+    extent_kji = (extent, extent + 1, extent + 2)
+    dxyz = (1.0, 1.0, 1.0)
+    crs_uuid = crs.uuid
+    title = "small_grid"
+    grid = grr.RegularGrid(model, extent_kji = extent_kji, dxyz = dxyz, crs_uuid = crs_uuid, title = title)
+    grid.create_xml()
+
+    n_points = 100
+    points = np.random.rand(n_points, 3) * extent
+    surface = rqs.Surface(model, crs_uuid = crs_uuid, title = "small_surface")
+    ps = rqs.PointSet(model, points_array = points, crs_uuid = crs_uuid, title = 'temp point set')
+    surface.set_from_point_set(ps,
+                               convexity_parameter = 0.05,
+                               reorient = True,
+                               extend_with_flange = True,
+                               flange_point_count = 11,
+                               flange_radial_factor = 10.0,
+                               flange_radial_distance = None,
+                               make_clockwise = False)
+    surface.triangles_and_points()
+    surface.write_hdf5()
+    surface.create_xml()
+
+    model.store_epc()
 
     return grid, surface
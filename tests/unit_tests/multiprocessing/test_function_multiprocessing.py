@@ -1,5 +1,6 @@
 import pytest
 import os
+import time
 import numpy as np
 
 import resqpy.model as rq
@@ -22,6 +23,30 @@ def make_feature(name, index, parent_tmp_dir):
     return (index, True, epc, [feat.uuid])
 
 
+def make_feature_all_parts(name, index, parent_tmp_dir):
+    index, success, epc, _ = make_feature(name, index, parent_tmp_dir)
+    return (index, success, epc, None)
+
+
+def fail_odd_index(name, index, parent_tmp_dir):
+    if index % 2:
+        return (index, False, None, [])
+    return make_feature(name, index, parent_tmp_dir)
+
+
+def make_feature_reverse_order(name, index, parent_tmp_dir, completed):
+    # later indices finish first, when run concurrently
+    time.sleep(0.1 * (4 - index))
+    result = make_feature(name, index, parent_tmp_dir)
+    completed.append(index)
+    return result
+
+
+def duplicate_first_index(name, index, parent_tmp_dir):
+    _, success, epc, uuids = make_feature(name, index, parent_tmp_dir)
+    return (0 if index == 1 else index, success, epc, uuids)
+
+
 def make_wellbore_frame_with_time_series_prop(x, y, t0_value, t2_value, index, parent_tmp_dir):
     epc = os.path.join(parent_tmp_dir, f'mp_ts_test_{index}.epc')
     model = rq.new_model(epc)
@@ -86,6 +111,125 @@ def test_fn_multiprocessing(tmp_path):
     assert all([t.startswith('structure') for t in names])
 
 
+def test_fn_multiprocessing_all_parts(tmp_path):
+    combo_epc = os.path.join(tmp_path, 'combo.epc')
+    n = 4
+    good = rqmp.function_multiprocessing(make_feature_all_parts,
+                                         kwargs_list = [{
+                                             'name': 'structure'
+                                         } for _ in range(n)],
+                                         recombined_epc = combo_epc,
+                                         require_success = True,
+                                         tmp_dir_path = tmp_path)
+    assert good == [True] * n
+    m = rq.Model(combo_epc)
+    assert len(m.titles(obj_type = 'OrganizationFeature')) == n
+
+
+def test_fn_multiprocessing_failures(tmp_path):
+    combo_epc = os.path.join(tmp_path, 'combo.epc')
+    n = 5
+    good = rqmp.function_multiprocessing(fail_odd_index,
+                                         kwargs_list = [{
+                                             'name': 'structure'
+                                         } for _ in range(n)],
+                                         recombined_epc = combo_epc,
+                                         cluster = None,
+                                         require_success = False,
+                                         tmp_dir_path = tmp_path)
+    assert good == [True, False, True, False, True]
+    m = rq.Model(combo_epc)
+    assert len(m.titles(obj_type = 'OrganizationFeature')) == 3
+    with pytest.raises(Exception):
+        rqmp.function_multiprocessing(fail_odd_index,
+                                      kwargs_list = [{
+                                          'name': 'structure'
+                                      } for _ in range(n)],
+                                      recombined_epc = os.path.join(tmp_path, 'failed.epc'),
+                                      cluster = None,
+                                      require_success = True,
+                                      tmp_dir_path = tmp_path)
+    assert not os.path.exists(os.path.join(tmp_path, 'failed.epc'))
+
+
+def test_fn_multiprocessing_threading_out_of_order(tmp_path, monkeypatch):
+    monkeypatch.setattr(rqmp.joblib, 'cpu_count', lambda: 4)
+    combo_epc = os.path.join(tmp_path, 'combo.epc')
+    n = 4
+    completed = []
+    # any cluster other than None runs the calls via joblib, here with the threading backend
+    good = rqmp.function_multiprocessing(make_feature_reverse_order,
+                                         kwargs_list = [{
+                                             'name': 'structure',
+                                             'completed': completed
+                                         } for _ in range(n)],
+                                         recombined_epc = combo_epc,
+                                         cluster = True,
+                                         require_success = True,
+                                         tmp_dir_path = tmp_path,
+                                         backend = 'threading',
+                                         batch_size = 1)
+    assert good == [True] * n
+    assert completed[0] != 0 and sorted(completed) == list(range(n))
+    m = rq.Model(combo_epc)
+    assert sorted(m.titles(obj_type = 'OrganizationFeature')) == [f'structure {i}' for i in range(n)]
+
+
+def test_fn_multiprocessing_threading_failures(tmp_path, monkeypatch):
+    monkeypatch.setattr(rqmp.joblib, 'cpu_count', lambda: 4)
+    n = 5
+    good = rqmp.function_multiprocessing(fail_odd_index,
+                                         kwargs_list = [{
+                                             'name': 'structure'
+                                         } for _ in range(n)],
+                                         recombined_epc = os.path.join(tmp_path, 'combo.epc'),
+                                         cluster = True,
+                                         require_success = False,
+                                         tmp_dir_path = tmp_path,
+                                         backend = 'threading',
+                                         batch_size = 1)
+    assert good == [True, False, True, False, True]
+    with pytest.raises(Exception):
+        rqmp.function_multiprocessing(fail_odd_index,
+                                      kwargs_list = [{
+                                          'name': 'structure'
+                                      } for _ in range(n)],
+                                      recombined_epc = os.path.join(tmp_path, 'failed.epc'),
+                                      cluster = True,
+                                      require_success = True,
+                                      tmp_dir_path = tmp_path,
+                                      backend = 'threading',
+                                      batch_size = 1)
+    assert not os.path.exists(os.path.join(tmp_path, 'failed.epc'))
+
+
+def test_fn_multiprocessing_duplicate_index(tmp_path, caplog):
+    combo_epc = os.path.join(tmp_path, 'combo.epc')
+    good = rqmp.function_multiprocessing(duplicate_first_index,
+                                         kwargs_list = [{
+                                             'name': 'structure'
+                                         } for _ in range(3)],
+                                         recombined_epc = combo_epc,
+                                         cluster = None,
+                                         require_success = False,
+                                         tmp_dir_path = tmp_path)
+    assert good == [False, False, True]
+    assert 'unexpected index 0' in caplog.text
+    assert 'no result returned' in caplog.text
+    m = rq.Model(combo_epc)
+    assert sorted(m.titles(obj_type = 'OrganizationFeature')) == ['structure 0', 'structure 2']
+    with pytest.raises(Exception):
+        rqmp.function_multiprocessing(duplicate_first_index,
+                                      kwargs_list = [{
+                                          'name': 'structure'
+                                      } for _ in range(3)],
+                                      recombined_epc = os.path.join(tmp_path, 'failed.epc'),
+                                      cluster = None,
+                                      require_success = True,
+                                      tmp_dir_path = tmp_path)
+    assert not os.path.exists(os.path.join(tmp_path, 'failed.epc'))
+
+
 def test_ts_recombination(tmp_path):
     # tmp_path = '/tmp/ts_rels'
     combo_epc = os.path.join(tmp_path, 'ts_combo.epc')
@@ -186,3 +330,35 @@ def test_ts_recombination(tmp_path):
         assert len(depends_on_p) == 0
         assert len(soft) == 1
         assert ts_uuid_int in p_depends_on
+
+
+def test_rm_tree(tmp_path):
+    root = os.path.join(tmp_path, 'tree')
+    for i in range(3):
+        sub_dir = os.path.join(root, f'sub_{i}', 'deeper')
+        os.makedirs(sub_dir)
+        for name in ('a.epc', 'a.h5'):
+            with open(os.path.join(sub_dir, name), 'w') as fp:
+                fp.write('x')
+    with open(os.path.join(root, 'top.txt'), 'w') as fp:
+        fp.write('x')
+    rqmp.rm_tree(root)
+    assert not os.path.exists(root)
+    rqmp.rm_tree(root)  # no error when directory does not exist
+
+
+def test_shared_values():
+    shared_array = np.zeros((10, 10))
+    shared_list = [1, 2, 3]
+    kwargs_list = [{
+        'name': 'structure',
+        'a': shared_array,
+        'b': shared_list,
+        'c': np.ones(3),
+        'index': i
+    } for i in range(3)]
+    shared = rqmp._shared_values(kwargs_list)
+    assert len(shared) == 2
+    assert any(v is shared_array for v in shared)
+    assert any(v is shared_list for v in shared)
+    assert rqmp._shared_values(kwargs_list[:1]) == []
@@ -1,5 +1,6 @@
 from typing import Tuple
 import numpy as np
+import pytest
 
 import resqpy.model as rq
 import resqpy.property as rqp
@@ -9,446 +10,219 @@ from resqpy.model import Model
 from resqpy.grid import RegularGrid
 from resqpy.surface import Surface, PointSet
 from resqpy.multi_processing.wrappers.grid_surface_mp import find_faces_to_represent_surface_regular_wrapper
-from resqpy.multi_processing._multiprocessing import rm_tree
 from resqpy.olio.random_seed import seed
 
 seed(83469613)
 
 
-def test_find_faces_to_represent_surface_regular_wrapper(small_grid_and_surface: Tuple[RegularGrid, Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(input_index,
-                                                                                          "tmp_dir",
-                                                                                          use_index_as_realisation,
-                                                                                          grid_epc,
-                                                                                          grid_uuid,
-                                                                                          surface_epc,
-                                                                                          surface_uuid,
-                                                                                          name,
-                                                                                          random_agitation = False,
-                                                                                          trimmed = True)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+@pytest.fixture(scope = 'module')
+def wrapper_results(tmp_path_factory):
+    """Returns a function which runs the wrapper for a grid and surface, caching the results by arguments.
+
+    note:
+       the wrapper is only run once for each distinct combination of grid, surface and keyword arguments within
+       this module; the returned tuple is the wrapper's (index, success, epc_file, uuid_list) extended with the
+       output model, opened once; the output models are shared between tests and must not be modified
+    """
+    tmp_dir = str(tmp_path_factory.mktemp('grid_surface_mp'))
+    results = {}
+
+    def run(grid, surface, **kwargs):
+        key = (grid.model.epc_file, str(grid.uuid), surface.model.epc_file, str(surface.uuid),
+               frozenset((k, tuple(v) if isinstance(v, list) else v) for k, v in kwargs.items()))
+        if key not in results:
+            index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
+                0, tmp_dir, False, grid.model.epc_file, grid.uuid, surface.model.epc_file, surface.uuid, "test",
+                **kwargs)
+            results[key] = (index, success, epc_file, uuid_list, Model(epc_file = epc_file))
+        return results[key]
+
+    yield run
+    for result in results.values():
+        result[-1].h5_release()
+
+
+def test_find_faces_to_represent_surface_regular_wrapper(shared_small_grid_and_surface: Tuple[RegularGrid, Surface],
+                                                         wrapper_results):
+    # Arrange
+    grid, surface = shared_small_grid_and_surface
+
+    # Act
+    index, success, epc_file, uuid_list, model = wrapper_results(grid,
+                                                                 surface,
+                                                                 random_agitation = False,
+                                                                 trimmed = True)
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
+    assert index == 0
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 1,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids()) == 9
     assert len(uuid_list) == 7
 
 
-def test_find_faces_to_represent_surface_regular_wrapper_point_set(small_grid_and_surface: Tuple[RegularGrid, Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
+def test_find_faces_to_represent_surface_regular_wrapper_point_set(shared_small_grid_and_surface: Tuple[RegularGrid,
+                                                                                                        Surface],
+                                                                   shared_point_set: PointSet, wrapper_results):
+    # Arrange
+    grid, surface = shared_small_grid_and_surface
     _, p = surface.triangles_and_points()
-    ps = PointSet(surface.model, points_array = p, crs_uuid = surface.crs_uuid, title = surface.title)
-    ps.write_hdf5()
-    ps.create_xml()
-    ps_uuid = ps.uuid
-    ps.model.store_epc()
-
-    name = "test pointset"
-    input_index = 0
-    use_index_as_realisation = False
+    assert np.shares_memory(shared_point_set.patch_array_list[0], p)
 
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(input_index,
-                                                                                          "tmp_dir",
-                                                                                          use_index_as_realisation,
-                                                                                          grid_epc,
-                                                                                          grid_uuid,
-                                                                                          surface_epc,
-                                                                                          ps_uuid,
-                                                                                          name,
-                                                                                          random_agitation = False,
-                                                                                          trimmed = True)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+    # Act
+    index, success, epc_file, uuid_list, model = wrapper_results(grid,
+                                                                 shared_point_set,
+                                                                 random_agitation = False,
+                                                                 trimmed = True)
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'PointSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
+    assert index == 0
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 1,
+        'PointSetRepresentation': 1,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids()) == 10
     assert len(uuid_list) == 7
 
 
-def test_find_faces_to_represent_surface_regular_wrapper_random_agitation(small_grid_and_surface: Tuple[RegularGrid,
-                                                                                                        Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
+def test_find_faces_to_represent_surface_regular_wrapper_random_agitation(
+        shared_small_grid_and_surface: Tuple[RegularGrid, Surface], wrapper_results):
+    # Arrange
+    grid, surface = shared_small_grid_and_surface
 
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(input_index,
-                                                                                          "tmp_dir",
-                                                                                          use_index_as_realisation,
-                                                                                          grid_epc,
-                                                                                          grid_uuid,
-                                                                                          surface_epc,
-                                                                                          surface_uuid,
-                                                                                          name,
-                                                                                          random_agitation = True,
-                                                                                          trimmed = True)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+    # Act
+    index, success, epc_file, uuid_list, model = wrapper_results(grid, surface, random_agitation = True, trimmed = True)
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
+    assert index == 0
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 1,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids()) == 9
     assert len(uuid_list) == 7
 
 
-def test_find_faces_to_represent_surface_regular_wrapper_properties(small_grid_and_surface: Tuple[RegularGrid,
-                                                                                                  Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+# yapf: disable
+@pytest.mark.parametrize('return_properties,wrapper_kwargs,expected_discrete,expected_uuids,expected_uuid_list',
+                         [(['triangle', 'offset'], {}, 1, 14, 9),
+                          (['triangle', 'offset'], {'extend_fault_representation': True}, 2, 16, 10),
+                          (['triangle', 'offset', 'flange bool'],
+                           {'extend_fault_representation': True, 'flange_radius': 3000.0}, 3, 17, 11),
+                          (['triangle', 'offset'],
+                           {'extend_fault_representation': True, 'flange_radius': 3000.0, 'reorient': False,
+                            'saucer_parameter': -60}, 2, 16, 10),
+                          (['triangle', 'offset'],
+                           {'extend_fault_representation': True, 'flange_radius': 3000.0, 'reorient': True,
+                            'saucer_parameter': -60}, 2, 16, 10)],
+                         ids = ['properties', 'flange', 'flange_radius', 'flange_radius_saucer_noreorient',
+                                'flange_radius_saucer_reorient'])
+# yapf: enable
+def test_find_faces_to_represent_surface_regular_wrapper_properties(shared_small_grid_and_surface: Tuple[RegularGrid,
+                                                                                                         Surface],
+                                                                    wrapper_results, return_properties, wrapper_kwargs,
+                                                                    expected_discrete, expected_uuids,
+                                                                    expected_uuid_list):
+    # Arrange
+    grid, surface = shared_small_grid_and_surface
+
+    # Act
+    index, success, epc_file, uuid_list, model = wrapper_results(grid,
+                                                                 surface,
+                                                                 return_properties = return_properties,
+                                                                 **wrapper_kwargs)
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 1
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
+    assert index == 0
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 2,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+        'DiscreteProperty': expected_discrete,
+        'ContinuousProperty': 4,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids(obj_type = 'PropertyKind', title = "offset")) == 1
-    assert len(model.uuids()) == 14
-    assert len(uuid_list) == 9
+    assert len(model.uuids()) == expected_uuids
+    assert len(uuid_list) == expected_uuid_list
 
 
-def test_find_faces_to_represent_surface_extended_bisector(small_grid_and_extended_surface: Tuple[RegularGrid,
-                                                                                                  Surface]):
-    # Arrange
-    grid, surface = small_grid_and_extended_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset", "grid bisector", "grid shadow"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
+def test_find_faces_to_represent_surface_extended_bisector(shared_small_grid_and_extended_surface: Tuple[RegularGrid,
+                                                                                                         Surface],
+                                                           wrapper_results):
+    # Arrange
+    grid, surface = shared_small_grid_and_extended_surface
 
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+    # Act
+    index, success, epc_file, uuid_list, model = wrapper_results(
+        grid, surface, return_properties = ["triangle", "offset", "grid bisector", "grid shadow"], use_pack = True)
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 3
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
-    assert len(model.uuids()) == 18
-    assert len(uuid_list) == 11
-
-
-def test_find_faces_to_represent_surface_regular_wrapper_properties_flange(small_grid_and_surface: Tuple[RegularGrid,
-                                                                                                         Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties,
-        extend_fault_representation = True)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
-
-    # Assert
-    assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 2
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
-    assert len(model.uuids()) == 16
-    assert len(uuid_list) == 10
-
-
-def test_find_faces_to_represent_surface_regular_wrapper_flange_radius(small_grid_and_surface: Tuple[RegularGrid,
-                                                                                                     Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset", "flange bool"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties,
-        extend_fault_representation = True,
-        flange_radius = 3000.0)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
-
-    # Assert
-    assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 3
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
-    assert len(model.uuids()) == 17
-    assert len(uuid_list) == 11
-
-
-def test_find_faces_to_represent_surface_extended_bisector_use_pack(small_grid_and_extended_surface: Tuple[RegularGrid,
-                                                                                                           Surface]):
-    # Arrange
-    grid, surface = small_grid_and_extended_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset", "grid bisector", "grid shadow"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties,
-        use_pack = True)
-    model = Model(epc_file = epc_file)
-
-    # Assert
-    assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 3
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
+    assert index == 0
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 2,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+        'DiscreteProperty': 3,
+        'ContinuousProperty': 4,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids()) == 18
     assert len(uuid_list) == 11
 
+    # packed bisector must unpack to a boolean cell array with the grid extent, splitting the grid in two, and pack
+    # back unchanged, ignoring the padding bits of the last byte in each row
+    bisector_count = 0
     for uuid in model.uuids(obj_type = 'DiscreteProperty'):
-        a = rqp.Property(model, uuid = uuid).array_ref()
+        prop = rqp.Property(model, uuid = uuid)
+        a = prop.array_ref()
         assert a is not None
-
-    rm_tree("tmp_dir")
-
-
-def test_find_faces_to_represent_surface_regular_wrapper_flange_radius_saucer_noreorient(
-        small_grid_and_surface: Tuple[RegularGrid, Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties,
-        extend_fault_representation = True,
-        flange_radius = 3000.0,
-        reorient = False,
-        saucer_parameter = -60)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
-
-    # Assert
-    assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 2
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
-    assert len(model.uuids()) == 16
-    assert len(uuid_list) == 10
-
-
-def test_find_faces_to_represent_surface_regular_wrapper_flange_radius_saucer_reorient(
-        small_grid_and_surface: Tuple[RegularGrid, Surface]):
-    # Arrange
-    grid, surface = small_grid_and_surface
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset"]
-
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        return_properties = return_properties,
-        extend_fault_representation = True,
-        flange_radius = 3000.0,
-        reorient = True,
-        saucer_parameter = -60)
-    model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
-
-    # Assert
-    assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 2
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
-    assert len(model.uuids()) == 16
-    assert len(uuid_list) == 10
-
-
-def test_find_faces_to_represent_surface_regular_wrapper_patchwork(small_grid_and_surface: Tuple[RegularGrid, Surface]):
+        if prop.title.endswith('bisector'):
+            bisector_count += 1
+            unpacked = np.unpackbits(a.astype(np.uint8), axis = -1, count = grid.ni).astype(bool)
+            assert unpacked.shape == tuple(grid.extent_kji)
+            assert np.any(unpacked) and not np.all(unpacked)
+            row_mask = np.packbits(np.ones(grid.ni, dtype = bool))
+            np.testing.assert_array_equal(np.packbits(unpacked, axis = -1), a.astype(np.uint8) & row_mask)
+    assert bisector_count == 1
+
+
+def test_find_faces_to_represent_surface_regular_wrapper_patchwork(small_grid_and_surface: Tuple[RegularGrid, Surface],
+                                                                   tmp_path):
     # Arrange
     grid, surface = small_grid_and_surface
     grid_epc = surface_epc = grid.model.epc_file
@@ -505,7 +279,7 @@ def test_find_faces_to_represent_surface_regular_wrapper_patchwork(small_grid_an
     # Act
     index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
         input_index,
-        "tmp_dir",
+        str(tmp_path),
         use_index_as_realisation,
         grid_epc,
         grid_uuid,
@@ -518,19 +292,22 @@ def test_find_faces_to_represent_surface_regular_wrapper_patchwork(small_grid_an
         grid_patching_property_uuid = grid_reg_prop.uuid,
         surface_patching_property_uuid = surf_reg_prop.uuid)
     model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
     assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 2
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 3
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 1,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+        'DiscreteProperty': 2,
+        'ContinuousProperty': 3,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids(obj_type = 'PropertyKind', title = "triangle index")) == 1
     assert len(model.uuids(obj_type = 'PropertyKind', title = "grid bisector")) == 1
     assert len(model.uuids()) == 16
@@ -538,7 +315,7 @@ def test_find_faces_to_represent_surface_regular_wrapper_patchwork(small_grid_an
 
 
 def test_find_faces_to_represent_surface_extended_patchwork(small_grid_and_extended_surface: Tuple[RegularGrid,
-                                                                                                   Surface]):
+                                                                                                   Surface], tmp_path):
     # Arrange
     grid, surface = small_grid_and_extended_surface
     assert surface.model is grid.model
@@ -595,7 +372,7 @@ def test_find_faces_to_represent_surface_extended_patchwork(small_grid_and_exten
     # Act
     index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
         input_index,
-        "tmp_dir",
+        str(tmp_path),
         use_index_as_realisation,
         grid_epc,
         grid_uuid,
@@ -607,66 +384,56 @@ def test_find_faces_to_represent_surface_extended_patchwork(small_grid_and_exten
         grid_patching_property_uuid = grid_reg_prop.uuid,
         surface_patching_property_uuid = surf_reg_prop.uuid)
     model = Model(epc_file = epc_file)
-    rm_tree("tmp_dir")
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
     assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 3
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 1,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+        'DiscreteProperty': 3,
+        'ContinuousProperty': 4,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids()) == 20
     assert len(uuid_list) == 11
 
 
 def test_find_faces_to_represent_surface_regular_wrapper_properties_triangles(
-        small_grid_and_surface_nonrandom: Tuple[RegularGrid, Surface]):
-    # Arrange
+        small_grid_and_surface_nonrandom: Tuple[RegularGrid, Surface], wrapper_results):
+    # Arrange
     grid, surface = small_grid_and_surface_nonrandom
-    grid_epc = surface_epc = grid.model.epc_file
-    grid_uuid = grid.uuid
-    surface_uuid = surface.uuid
-    return_properties = ["triangle", "offset"]
 
-    name = "test"
-    input_index = 0
-    use_index_as_realisation = False
-
-    # Act
-    index, success, epc_file, uuid_list = find_faces_to_represent_surface_regular_wrapper(
-        input_index,
-        "tmp_dir",
-        use_index_as_realisation,
-        grid_epc,
-        grid_uuid,
-        surface_epc,
-        surface_uuid,
-        name,
-        extend_fault_representation = True,
-        feature_type = 'fault',
-        return_properties = return_properties)
-    model = Model(epc_file = epc_file)
+    # Act
+    index, success, epc_file, uuid_list, model = wrapper_results(grid,
+                                                                 surface,
+                                                                 extend_fault_representation = True,
+                                                                 feature_type = 'fault',
+                                                                 return_properties = ["triangle", "offset"])
+    counts = model.parts_count_dict()
 
     # Assert
     assert success is True
-    assert index == input_index
-    assert len(model.uuids(obj_type = 'LocalDepth3dCrs')) == 1
-    assert len(model.uuids(obj_type = 'IjkGridRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'TriangulatedSetRepresentation')) == 2
-    assert len(model.uuids(obj_type = 'GridConnectionSetRepresentation')) == 1
-    assert len(model.uuids(obj_type = 'FaultInterpretation')) == 1
-    assert len(model.uuids(obj_type = 'TectonicBoundaryFeature')) == 1
-    assert len(model.uuids(obj_type = 'DiscreteProperty')) == 2
-    assert len(model.uuids(obj_type = 'ContinuousProperty')) == 4
+    assert index == 0
+    expected_counts = {
+        'LocalDepth3dCrs': 1,
+        'IjkGridRepresentation': 1,
+        'TriangulatedSetRepresentation': 2,
+        'GridConnectionSetRepresentation': 1,
+        'FaultInterpretation': 1,
+        'TectonicBoundaryFeature': 1,
+        'DiscreteProperty': 2,
+        'ContinuousProperty': 4,
+    }
+    assert {obj_type: counts.get(obj_type, 0) for obj_type in expected_counts} == expected_counts
     assert len(model.uuids(obj_type = 'PropertyKind', title = "offset")) == 1
     assert len(model.uuids()) == 16
     assert len(uuid_list) == 10
     triangle_array = rqp.Property(model, uuid = model.uuid(title = 'small_surface extended triangle')).array_ref()
     expected_triangles = np.array([11, 29, 18, 19, 21, 23, 26, 18, 21, 9, 9, 9, 26, 23, 21, 21, 27, 23, 29, 25])
     np.testing.assert_array_equal(triangle_array, expected_triangles)
-    rm_tree("tmp_dir")
@@ -3,12 +3,14 @@
 import os
 
 import numpy as np
+import pytest
 
 import resqpy.crs as rqc
 import resqpy.grid as grr
 import resqpy.grid._extract_functions as ef
 import resqpy.model as rq
 import resqpy.olio.uuid as bu
+import resqpy.olio.xml_et as rqet
 import resqpy.organize as rqo
 import resqpy.strata as strata
 # import resqpy.organize as rqo_new
@@ -161,6 +163,16 @@ def test_strata(tmp_path, caplog):
             pou_set.add(contact.part_of_uuid)
     assert hi_uuid_set == pou_set
 
+    # check that deposition modes and thickness ranges are reloaded
+
+    for sui in strata_column_ri.iter_units():
+        assert sui.deposition_mode == mode_list[unit_list.index(sui.title)]
+        if sui.title == 'mudstone unit':
+            assert sui.min_thickness == 250.0 and sui.max_thickness == 300.0
+            assert sui.thickness_uom == 'cm'
+        else:
+            assert sui.min_thickness is None and sui.max_thickness is None
+
     # check column rank units and contacts are well ordered
 
     previous_unit_index = -1
@@ -198,3 +210,55 @@ def test_strata(tmp_path, caplog):
     assert grid.stratigraphic_units is None
     # And an error should have been logged.
     assert "Unable to load Stratigraphy," in caplog.text
+
+
+def test_stratigraphic_unit_feature_top_and_bottom(tmp_path):
+    epc = os.path.join(tmp_path, 'chrono.epc')
+    model = rq.new_model(epc_file = epc)
+    jurassic = strata.StratigraphicUnitFeature(model, title = 'Jurassic')
+    jurassic.create_xml()
+    triassic = strata.StratigraphicUnitFeature(model, title = 'Triassic')
+    triassic.create_xml()
+    mixed = strata.StratigraphicUnitFeature(model,
+                                            title = 'Triassic to Jurassic',
+                                            top_unit_uuid = jurassic.uuid,
+                                            bottom_unit_uuid = triassic.uuid)
+    mixed.create_xml()
+    same = strata.StratigraphicUnitFeature(model,
+                                           title = 'Jurassic only',
+                                           top_unit_uuid = jurassic.uuid,
+                                           bottom_unit_uuid = jurassic.uuid)
+    same.create_xml()
+    model.store_epc()
+
+    model = rq.Model(epc)
+    mixed = strata.StratigraphicUnitFeature(model, uuid = mixed.uuid)
+    assert bu.matching_uuids(mixed.top_unit_uuid, jurassic.uuid)
+    assert bu.matching_uuids(mixed.bottom_unit_uuid, triassic.uuid)
+    assert model.title(uuid = mixed.top_unit_uuid) == 'Jurassic'
+    related = model.parts_list_related_to_uuid_of_type(mixed.uuid, 'StratigraphicUnitFeature')
+    assert len(related) == 2
+    same = strata.StratigraphicUnitFeature(model, uuid = same.uuid)
+    assert bu.matching_uuids(same.top_unit_uuid, same.bottom_unit_uuid)
+    related = model.parts_list_related_to_uuid_of_type(same.uuid, 'StratigraphicUnitFeature')
+    assert len(related) == 1
+
+
+def test_geologic_unit_interpretation_domain_checks(tmp_path):
+    epc = os.path.join(tmp_path, 'domain.epc')
+    model = rq.new_model(epc_file = epc)
+    guf = rqo.GeologicUnitFeature(model, feature_name = 'unit')
+    guf.create_xml()
+    gui = strata.GeologicUnitInterpretation(model, geologic_unit_feature = guf, domain = 'depth')
+    gui.domain = 'unknown'
+    with pytest.raises(AssertionError):
+        gui.create_xml()
+    gui.domain = 'depth'
+    gui.create_xml()
+    # an existing file may hold a domain value which resqpy would not accept for a new object
+    rqet.find_tag(gui.root, 'Domain').text = 'unknown'
+    model.store_epc()
+
+    model = rq.Model(epc)
+    gui = strata.GeologicUnitInterpretation(model, uuid = gui.uuid)
+    assert gui.domain == 'unknown'
@@ -526,6 +526,19 @@ def test_explicit_mesh(example_model_and_crs):
     assert_array_almost_equal(persistent_mesh.full_array_ref(), mesh.full_array_ref())
 
 
+def test_explicit_mesh_copy_xyz_values(example_model_and_crs):
+    model, crs = example_model_and_crs
+    xyz_values = np.random.random((3, 4, 3))
+    mesh = rqs.Mesh(model, crs_uuid = crs.uuid, mesh_flavour = 'explicit', xyz_values = xyz_values)
+    assert not np.shares_memory(mesh.full_array_ref(), xyz_values)
+    mesh = rqs.Mesh(model,
+                    crs_uuid = crs.uuid,
+                    mesh_flavour = 'explicit',
+                    xyz_values = xyz_values,
+                    copy_xyz_values = False)
+    assert mesh.full_array_ref() is xyz_values
+
+
 @pytest.mark.parametrize('flavour,infile,filetype', [('explicit', 'Surface_roxartext.txt', 'roxar'),
                                                      ('explicit', 'Surface_roxartext.txt', 'rms'),
                                                      ('explicit', 'Surface_zmap.dat', 'zmap'),
@@ -160,6 +160,23 @@ def test_from_array_of_points(example_model_and_crs):
     assert np.all(ps2.full_array_ref() == ps.full_array_ref())
 
 
+def test_from_array_of_points_copy(example_model_and_crs):
+    model, crs = example_model_and_crs
+    a = np.array([(4.5, 3.2, 1.7), (8.8, 3.6, 9.0), (1.5, 7.7, 5.4)], dtype = float)
+    ps = resqpy.surface.PointSet(model, points_array = a, crs_uuid = crs.uuid, title = 'copied points')
+    assert not np.shares_memory(ps.patch_array_list[0], a)
+    ps = resqpy.surface.PointSet(model,
+                                 points_array = a,
+                                 crs_uuid = crs.uuid,
+                                 title = 'shared points',
+                                 copy_points_array = False)
+    assert np.shares_memory(ps.patch_array_list[0], a)
+    xy = a[:, :2].copy()
+    ps = resqpy.surface.PointSet(model, points_array = xy, crs_uuid = crs.uuid, copy_points_array = False)
+    assert not np.shares_memory(ps.patch_array_list[0], xy)
+    assert np.all(ps.patch_array_list[0][:, :2] == xy) and np.all(ps.patch_array_list[0][:, 2] == 0.0)
+
+
 def test_trim_to_xyz_box(example_model_and_crs):
     model, crs = example_model_and_crs
     a = np.array([(4.5, 3.2, 1.7), (8.8, 3.6, 9.0), (1.5, 7.7, 5.4)], dtype = float)
@@ -7,6 +7,13 @@ import resqpy.crs as rqc
 import resqpy.surface as rqs
 import resqpy.olio.uuid as bu
 
+root_3 = maths.sqrt(3.0)
+
+
+def _in_range(a, lo, hi):
+    """Returns bool array, True where lo <= a < hi, using one unsigned comparison rather than two."""
+    return (a - lo).astype(np.uint64) < (hi - lo)
+
 
 def test_tri_mesh_create_save_reload(example_model_and_crs):
 
@@ -24,7 +31,7 @@ def test_tri_mesh_create_save_reload(example_model_and_crs):
         assert_array_almost_equal(xyz[1, :, 0], (5.0, 15.0, 25.0, 35.0))
         assert_array_almost_equal(xyz[0, :, 0], xyz[2, :, 0])
         for i in range(4):
-            assert_array_almost_equal(xyz[:, i, 1], np.array((0.0, 5.0 * maths.sqrt(3.0), 10.0 * maths.sqrt(3.0))))
+            assert_array_almost_equal(xyz[:, i, 1], np.array((0.0, 5.0 * root_3, 10.0 * root_3)))
 
     model, crs = example_model_and_crs
     trim = rqs.TriMesh(model, t_side = 10.0, nj = 3, ni = 4, crs_uuid = crs.uuid, title = 'test tri mesh')
@@ -127,37 +134,32 @@ def test_from_tri_mesh_and_z_values(example_model_and_crs):
     assert_array_almost_equal(trim_2_reload.full_array_ref()[..., 2], z_values_2)
 
 
+# points and expected tji for a tri mesh with t_side 10.0 and 4 x 4 nodes; (-1, -1) where point is outside mesh
+tji_xy = np.array([(0.0, 5.0), (5.0, 5.0), (10.0, 5.0), (15.0, 5.0), (25.0, 5.0), (30.0, 5.0), (35.0, 5.0), (5.0, 9.0),
+                   (6.0, 9.0), (30.0, 17.0), (29.0, 17.0), (5.0, 25.5), (30.0, 25.5), (30.0, 26.0)],
+                  dtype = float)
+tji_expected = np.array([(-1, -1), (0, 0), (0, 1), (0, 2), (0, 4), (0, 5), (-1, -1), (1, 0), (1, 1), (1, 5), (1, 4),
+                         (2, 0), (2, 5), (-1, -1)],
+                        dtype = int)
+
+
 def test_tri_mesh_tji_for_xy(example_model_and_crs):
     model, crs = example_model_and_crs
     trim = rqs.TriMesh(model, t_side = 10.0, nj = 4, ni = 4, crs_uuid = crs.uuid, title = 'test tri mesh')
-    assert trim.tji_for_xy((0.0, 5.0)) is None
-    assert trim.tji_for_xy((5.0, 5.0)) == (0, 0)
-    assert trim.tji_for_xy((10.0, 5.0)) == (0, 1)
-    assert trim.tji_for_xy((15.0, 5.0)) == (0, 2)
-    assert trim.tji_for_xy((25.0, 5.0)) == (0, 4)
-    assert trim.tji_for_xy((30.0, 5.0)) == (0, 5)
-    assert trim.tji_for_xy((35.0, 5.0)) is None
-    assert trim.tji_for_xy((5.0, 9.0)) == (1, 0)
-    assert trim.tji_for_xy((6.0, 9.0)) == (1, 1)
-    assert trim.tji_for_xy((30.0, 17.0)) == (1, 5)
-    assert trim.tji_for_xy((29.0, 17.0)) == (1, 4)
-    assert trim.tji_for_xy((5.0, 25.5)) == (2, 0)
-    assert trim.tji_for_xy((30.0, 25.5)) == (2, 5)
-    assert trim.tji_for_xy((30.0, 26.0)) is None
+    for xy, etji in zip(tji_xy, tji_expected):
+        tji = trim.tji_for_xy(tuple(xy))
+        if etji[0] < 0:
+            assert tji is None
+        else:
+            assert tji == tuple(etji)
 
 
 def test_tri_mesh_tji_for_xy_array(example_model_and_crs):
     model, crs = example_model_and_crs
     trim = rqs.TriMesh(model, t_side = 10.0, nj = 4, ni = 4, crs_uuid = crs.uuid, title = 'test tri mesh')
-    xy = np.array([(0.0, 5.0), (5.0, 5.0), (10.0, 5.0), (15.0, 5.0), (25.0, 5.0), (30.0, 5.0), (35.0, 5.0), (5.0, 9.0),
-                   (6.0, 9.0), (30.0, 17.0), (29.0, 17.0), (5.0, 25.5), (30.0, 25.5), (30.0, 26.0)],
-                  dtype = float)
-    etji = np.array([(-1, -1), (0, 0), (0, 1), (0, 2), (0, 4), (0, 5), (-1, -1), (1, 0), (1, 1), (1, 5), (1, 4), (2, 0),
-                     (2, 5), (-1, -1)],
-                    dtype = int)
-    tji = trim.tji_for_xy_array(xy)
+    tji = trim.tji_for_xy_array(tji_xy)
     assert tji.shape == (14, 2)
-    assert np.all(tji == etji)
+    np.testing.assert_array_equal(tji, tji_expected)
 
 
 def test_tri_mesh_tri_nodes_for_tji(example_model_and_crs):
@@ -195,6 +197,7 @@ def test_tri_mesh_all_tri_nodes(example_model_and_crs):
     trim = rqs.TriMesh(model, t_side = 0.7, nj = 3, ni = 4, crs_uuid = crs.uuid, title = 'test tri mesh')
     all_nodes = trim.all_tri_nodes()
     assert all_nodes.shape == ((2, 6, 3, 2))
+    assert all_nodes.dtype == np.int32
     for j in range(2):
         for i in range(6):
             assert np.all(all_nodes[j, i] == trim.tri_nodes_for_tji((j, i)))
@@ -212,8 +215,15 @@ def test_tri_mesh_triangles_and_points(example_model_and_crs):
     assert trim.tji_for_triangle_index(3) == (0, 3)
     assert trim.tji_for_triangle_index(4) == (1, 0)
     assert trim.tji_for_triangle_index(11) == (2, 3)
-    for ti in range(12):
-        assert trim.triangle_index_for_tji(trim.tji_for_triangle_index(ti)) == ti
+    assert trim.triangle_index_for_tji((0, 3)) == 3
+    assert trim.triangle_index_for_tji((2, 3)) == 11
+    tji = trim.tji_for_triangle_index_array(np.array([0, 1, 3, 4, 11, 12, -1], dtype = int))
+    assert np.all(tji == [(0, 0), (0, 1), (0, 3), (1, 0), (2, 3), (-1, -1), (-1, -1)])
+    assert np.all(trim.triangle_index_for_tji_array(tji) == (0, 1, 3, 4, 11, -1, -1))
+    assert np.all(trim.triangle_index_for_tji_array(trim.tji_for_triangle_index_array(np.arange(12))) == np.arange(12))
+    assert trim.triangle_index_for_tji_array(np.array((2, 3), dtype = int)) == 11
+    assert trim.triangle_index_for_tji_array(np.array((3, 0), dtype = int)) == -1
+    assert np.all(trim.triangle_index_for_tji_array([(0, 3), (2, 3), (0, 4)]) == (3, 11, -1))
 
 
 def test_surface_from_tri_mesh(example_model_and_crs):
@@ -231,48 +241,72 @@ def test_tri_mesh_trilinear_coordinates(example_model_and_crs):
     model, crs = example_model_and_crs
     trim = rqs.TriMesh(model, t_side = 100.0, nj = 3, ni = 3, crs_uuid = crs.uuid, title = 'test tri mesh')
     third = 1.0 / 3.0
-    tji, tc = trim.tji_tc_for_xy((50.0, 100.0 * maths.sqrt(3.0) / 6.0))
+    tji, tc = trim.tji_tc_for_xy((50.0, 100.0 * root_3 / 6.0))
     assert tji == (0, 0)
     assert_array_almost_equal(tc, (third, third, third))
-    tji, tc = trim.tji_tc_for_xy((100.0, 100.0 * maths.sqrt(3.0) * 2.0 / 3.0))
+    tji, tc = trim.tji_tc_for_xy((100.0, 100.0 * root_3 * 2.0 / 3.0))
     assert tji == (1, 1)
     assert_array_almost_equal(tc, (third, third, third))
-    tji, tc = trim.tji_tc_for_xy((150.0, 100.0 * maths.sqrt(3.0) - 1.0e-10))
+    tji, tc = trim.tji_tc_for_xy((150.0, 100.0 * root_3 - 1.0e-10))
     assert tji == (1, 2)
     assert_array_almost_equal(tc, (0.5, 0.5, 0.0))
-    tji, tc = trim.tji_tc_for_xy((175.0 - 1.0e-10, 100.0 * maths.sqrt(3.0) / 4.0 - 1.0e-10))
+    tji, tc = trim.tji_tc_for_xy((175.0 - 1.0e-10, 100.0 * root_3 / 4.0 - 1.0e-10))
     assert tji == (0, 2)
     assert_array_almost_equal(tc, (0.0, 0.5, 0.5))
-    tji, tc = trim.tji_tc_for_xy((50.0, 100.0 * maths.sqrt(3.0) / 2.0 - 1.0e-10))
+    tji, tc = trim.tji_tc_for_xy((50.0, 100.0 * root_3 / 2.0 - 1.0e-10))
     assert tji == (0, 0)
     assert_array_almost_equal(tc, (0.0, 0.0, 1.0))
-    tji, tc = trim.tji_tc_for_xy((150.0, 100.0 * maths.sqrt(3.0) / 2.0 + 1.0e-10))
+    tji, tc = trim.tji_tc_for_xy((150.0, 100.0 * root_3 / 2.0 + 1.0e-10))
     assert tji == (1, 2)
     assert_array_almost_equal(tc, (0.0, 0.0, 1.0))
     tji, tc = trim.tji_tc_for_xy((25.0, 50.0))
     assert tji is None and tc is None
 
 
+def test_tri_mesh_trilinear_coordinates_array(example_model_and_crs):
+    model, crs = example_model_and_crs
+    trim = rqs.TriMesh(model, t_side = 100.0, nj = 3, ni = 3, crs_uuid = crs.uuid, title = 'test tri mesh')
+    xy = np.array([(50.0, 100.0 * root_3 / 6.0), (100.0, 100.0 * root_3 * 2.0 / 3.0), (150.0, 100.0 * root_3 - 1.0e-10),
+                   (175.0 - 1.0e-10, 100.0 * root_3 / 4.0 - 1.0e-10), (50.0, 100.0 * root_3 / 2.0 - 1.0e-10),
+                   (150.0, 100.0 * root_3 / 2.0 + 1.0e-10), (25.0, 50.0)],
+                  dtype = float)
+    tji, tc = trim.tji_tc_for_xy_array(xy)
+    ji, w = trim.ji_and_weights_for_xy_array(xy)
+    assert tji.shape == (7, 2) and tc.shape == (7, 3)
+    assert ji.shape == (7, 3, 2) and w.shape == (7, 3)
+    for n in range(len(xy)):
+        e_tji, e_tc = trim.tji_tc_for_xy(tuple(xy[n]))
+        e_ji, _ = trim.ji_and_weights_for_xy(tuple(xy[n]))
+        if e_tji is None:
+            assert np.all(tji[n] == -1) and np.all(ji[n] == -1)
+            assert np.all(np.isnan(tc[n])) and np.all(np.isnan(w[n]))
+        else:
+            assert tuple(tji[n]) == e_tji
+            assert_array_almost_equal(tc[n], e_tc)
+            assert np.all(ji[n] == e_ji)
+            assert_array_almost_equal(w[n], e_tc)
+
+
 def test_tri_mesh_ji_and_weights(example_model_and_crs):
     model, crs = example_model_and_crs
     trim = rqs.TriMesh(model, t_side = 100.0, nj = 3, ni = 3, crs_uuid = crs.uuid, title = 'test tri mesh')
     third = 1.0 / 3.0
-    ji, tc = trim.ji_and_weights_for_xy((50.0, 100.0 * maths.sqrt(3.0) / 6.0))
+    ji, tc = trim.ji_and_weights_for_xy((50.0, 100.0 * root_3 / 6.0))
     assert np.all(ji == [(0, 0), (0, 1), (1, 0)])
     assert_array_almost_equal(tc, (third, third, third))
-    ji, tc = trim.ji_and_weights_for_xy((100.0, 100.0 * maths.sqrt(3.0) * 2.0 / 3.0))
+    ji, tc = trim.ji_and_weights_for_xy((100.0, 100.0 * root_3 * 2.0 / 3.0))
     assert np.all(ji == [(1, 0), (1, 1), (2, 1)])
     assert_array_almost_equal(tc, (third, third, third))
-    ji, tc = trim.ji_and_weights_for_xy((150.0, 100.0 * maths.sqrt(3.0) - 1.0e-10))
+    ji, tc = trim.ji_and_weights_for_xy((150.0, 100.0 * root_3 - 1.0e-10))
     assert np.all(ji == [(2, 1), (2, 2), (1, 1)])
     assert_array_almost_equal(tc, (0.5, 0.5, 0.0))
-    ji, tc = trim.ji_and_weights_for_xy((175.0 - 1.0e-10, 100.0 * maths.sqrt(3.0) / 4.0 - 1.0e-10))
+    ji, tc = trim.ji_and_weights_for_xy((175.0 - 1.0e-10, 100.0 * root_3 / 4.0 - 1.0e-10))
     assert np.all(ji == [(0, 1), (0, 2), (1, 1)])
     assert_array_almost_equal(tc, (0.0, 0.5, 0.5))
-    ji, tc = trim.ji_and_weights_for_xy((50.0, 100.0 * maths.sqrt(3.0) / 2.0 - 1.0e-10))
+    ji, tc = trim.ji_and_weights_for_xy((50.0, 100.0 * root_3 / 2.0 - 1.0e-10))
     assert np.all(ji == [(0, 0), (0, 1), (1, 0)])
     assert_array_almost_equal(tc, (0.0, 0.0, 1.0))
-    ji, tc = trim.ji_and_weights_for_xy((150.0, 100.0 * maths.sqrt(3.0) / 2.0 + 1.0e-10))
+    ji, tc = trim.ji_and_weights_for_xy((150.0, 100.0 * root_3 / 2.0 + 1.0e-10))
     assert np.all(ji == [(2, 1), (2, 2), (1, 1)])
     assert_array_almost_equal(tc, (0.0, 0.0, 1.0))
 
@@ -287,17 +321,17 @@ def test_tri_mesh_z_interpolation(example_model_and_crs):
                        z_values = z_values,
                        crs_uuid = crs.uuid,
                        title = 'test tri mesh')
-    z = trim.interpolated_z((50.0, 100.0 * maths.sqrt(3.0) / 6.0))
+    z = trim.interpolated_z((50.0, 100.0 * root_3 / 6.0))
     assert maths.isclose(z, 850.0 / 3.0)
-    z = trim.interpolated_z((100.0, 100.0 * maths.sqrt(3.0) * 2.0 / 3.0))
+    z = trim.interpolated_z((100.0, 100.0 * root_3 * 2.0 / 3.0))
     assert maths.isclose(z, 400.0)
-    z = trim.interpolated_z((150.0, 100.0 * maths.sqrt(3.0) - 1.0e-10))
+    z = trim.interpolated_z((150.0, 100.0 * root_3 - 1.0e-10))
     assert maths.isclose(z, 375.0)
-    z = trim.interpolated_z((175.0, 100.0 * maths.sqrt(3.0) / 4.0))
+    z = trim.interpolated_z((175.0, 100.0 * root_3 / 4.0))
     assert maths.isclose(z, 375.0)
-    z = trim.interpolated_z((50.0, 100.0 * maths.sqrt(3.0) / 2.0 - 1.0e-10))
+    z = trim.interpolated_z((50.0, 100.0 * root_3 / 2.0 - 1.0e-10))
     assert maths.isclose(z, 400.0)
-    z = trim.interpolated_z((150.0, 100.0 * maths.sqrt(3.0) / 2.0 + 1.0e-10))
+    z = trim.interpolated_z((150.0, 100.0 * root_3 / 2.0 + 1.0e-10))
     assert maths.isclose(z, 450.0)
     z = trim.interpolated_z((25.0, 50.0))
     assert z is None
@@ -313,10 +347,9 @@ def test_tri_mesh_z_interpolation_array(example_model_and_crs):
                        z_values = z_values,
                        crs_uuid = crs.uuid,
                        title = 'test tri mesh')
-    xy = np.array([(50.0, 100.0 * maths.sqrt(3.0) / 6.0), (100.0, 100.0 * maths.sqrt(3.0) * 2.0 / 3.0),
-                   (150.0, 100.0 * maths.sqrt(3.0) - 1.0e-10), (175.0, 100.0 * maths.sqrt(3.0) / 4.0),
-                   (50.0, 100.0 * maths.sqrt(3.0) / 2.0 - 1.0e-10), (150.0, 100.0 * maths.sqrt(3.0) / 2.0 + 1.0e-10),
-                   (25.0, 50.0)],
+    xy = np.array([(50.0, 100.0 * root_3 / 6.0), (100.0, 100.0 * root_3 * 2.0 / 3.0), (150.0, 100.0 * root_3 - 1.0e-10),
+                   (175.0, 100.0 * root_3 / 4.0), (50.0, 100.0 * root_3 / 2.0 - 1.0e-10),
+                   (150.0, 100.0 * root_3 / 2.0 + 1.0e-10), (25.0, 50.0)],
                   dtype = float)
     z = trim.interpolated_z_array(xy)
     ez = np.array([850.0 / 3.0, 400.0, 375.0, 375.0, 400.0, 450.0, np.nan], dtype = float)
@@ -332,8 +365,8 @@ def test_tri_mesh_nodes_in_triangles(example_model_and_crs):
     assert nit.ndim == 2 and nit.shape[1] == 3
     assert len(nit) == 6
     assert np.all(np.logical_or(nit[:, 0] == 0, nit[:, 0] == 1))  # other triangle number
-    assert np.all(np.logical_and(nit[:, 1] > 0, nit[:, 1] < 3))  # node j index
-    assert np.all(np.logical_and(nit[:, 2] > 0, nit[:, 2] < 4))  # node i index
+    assert np.all(_in_range(nit[:, 1], 1, 3))  # node j index
+    assert np.all(_in_range(nit[:, 2], 1, 4))  # node i index
     assert np.count_nonzero(nit[:, 0] == 0) == 3
     assert np.count_nonzero(nit[:, 0] == 1) == 3
     for i in range(6):
@@ -359,13 +392,13 @@ def test_tri_mesh_nodes_in_triangles_with_origin(example_model_and_crs):
                                         (37.0, 5.0)], [(42.0, 15.0), (55.0, 15.0),
                                                        (51.0, 3.0)], [(43.0, 25.0), (47.0, 25.0), (45.0, 28.0)]],
                        dtype = float)
-    other_t += np.expand_dims(np.expand_dims(np.array(origin[:2], dtype = float), axis = 0), axis = 0)
+    other_t += origin[:2]
     nit = trim.tri_nodes_in_triangles(other_t)
     assert nit.ndim == 2 and nit.shape[1] == 3
     assert len(nit) == 7
     assert np.all(np.logical_or(np.logical_or(nit[:, 0] == 0, nit[:, 0] == 1), nit[:, 0] == 3))  # other triangle number
-    assert np.all(np.logical_and(nit[:-1, 1] > 0, nit[:-1, 1] < 3))  # node j index
-    assert np.all(np.logical_and(nit[:-1, 2] > 0, nit[:-1, 2] < 4))  # node i index
+    assert np.all(_in_range(nit[:-1, 1], 1, 3))  # node j index
+    assert np.all(_in_range(nit[:-1, 2], 1, 4))  # node i index
     assert np.all(nit[-1] == (3, 3, 4))  # other triangle number, node j, node i; here assumed to be last in return list
     assert np.count_nonzero(nit[:, 0] == 0) == 3
     assert np.count_nonzero(nit[:, 0] == 1) == 3
@@ -394,13 +427,13 @@ def test_tri_mesh_nodes_in_triangles_with_origin_nan_z(example_model_and_crs):
                                         (37.0, 5.0)], [(42.0, 15.0), (55.0, 15.0),
                                                        (51.0, 3.0)], [(43.0, 25.0), (47.0, 25.0), (45.0, 28.0)]],
                        dtype = float)
-    other_t += np.expand_dims(np.expand_dims(np.array(origin[:2], dtype = float), axis = 0), axis = 0)
+    other_t += origin[:2]
     nit = trim.tri_nodes_in_triangles(other_t)
     assert nit.ndim == 2 and nit.shape[1] == 3
     assert len(nit) == 7
     assert np.all(np.logical_or(np.logical_or(nit[:, 0] == 0, nit[:, 0] == 1), nit[:, 0] == 3))  # other triangle number
-    assert np.all(np.logical_and(nit[:-1, 1] > 0, nit[:-1, 1] < 3))  # node j index
-    assert np.all(np.logical_and(nit[:-1, 2] > 0, nit[:-1, 2] < 4))  # node i index
+    assert np.all(_in_range(nit[:-1, 1], 1, 3))  # node j index
+    assert np.all(_in_range(nit[:-1, 2], 1, 4))  # node i index
     assert np.all(nit[-1] == (3, 3, 4))  # other triangle number, node j, node i; here assumed to be last in return list
     assert np.count_nonzero(nit[:, 0] == 0) == 3
     assert np.count_nonzero(nit[:, 0] == 1) == 3
@@ -430,22 +463,22 @@ def test_tri_mesh_axial_edge_crossing(example_model_and_crs):
     assert z_cross.shape == (7, 3)
     xi = np.argsort(z_cross[:, 0])
     assert_array_almost_equal(z_cross[:, 2], 0.0)
-    assert_array_almost_equal(z_cross[:, 1], 50.0 * maths.sqrt(3.0) / 2.0)
+    assert_array_almost_equal(z_cross[:, 1], 50.0 * root_3 / 2.0)
     assert_array_almost_equal(z_cross[xi[1:], 0] - z_cross[xi[:-1], 0], 50.0)
     assert maths.isclose(z_cross[xi[0], 0], 25.0)
     z_cross = trim.axial_edge_crossings(2, value = 300.0)
     assert z_cross.shape == (7, 3)
     xi = np.argsort(z_cross[:, 0])
     assert_array_almost_equal(z_cross[:, 2], 300.0)
-    assert_array_almost_equal(z_cross[:, 1], 150.0 * maths.sqrt(3.0) / 2.0)
+    assert_array_almost_equal(z_cross[:, 1], 150.0 * root_3 / 2.0)
     assert_array_almost_equal(z_cross[xi[1:], 0] - z_cross[xi[:-1], 0], 50.0)
     assert maths.isclose(z_cross[xi[0], 0], 25.0)
     # y axis
-    z_cross = trim.axial_edge_crossings(1, value = 150.0 * maths.sqrt(3.0) / 2.0)
+    z_cross = trim.axial_edge_crossings(1, value = 150.0 * root_3 / 2.0)
     assert z_cross.shape == (7, 3)
     xi = np.argsort(z_cross[:, 0])
     assert_array_almost_equal(z_cross[:, 2], 300.0)
-    assert_array_almost_equal(z_cross[:, 1], 150.0 * maths.sqrt(3.0) / 2.0)
+    assert_array_almost_equal(z_cross[:, 1], 150.0 * root_3 / 2.0)
     assert_array_almost_equal(z_cross[xi[1:], 0] - z_cross[xi[:-1], 0], 50.0)
     assert maths.isclose(z_cross[xi[0], 0], 25.0)
     # x axis
@@ -453,7 +486,7 @@ def test_tri_mesh_axial_edge_crossing(example_model_and_crs):
     assert z_cross.shape == (5, 3)
     yi = np.argsort(z_cross[:, 1])
     assert_array_almost_equal(z_cross[yi, 2], (-100.0, 0.0, 100.0, 300.0, 500.0))
-    assert_array_almost_equal(z_cross[yi[1:], 1] - z_cross[yi[:-1], 1], 50.0 * maths.sqrt(3.0) / 2.0)
+    assert_array_almost_equal(z_cross[yi[1:], 1] - z_cross[yi[:-1], 1], 50.0 * root_3 / 2.0)
     maths.isclose(z_cross[yi[0], 1], 0.0)
     assert_array_almost_equal(z_cross[:, 0], 125.0)
 
@@ -559,7 +592,7 @@ def test_tri_mesh_area(example_model_and_crs):
     area_m2 = trim.area(required_uom = 'm2')
     area_ha = trim.area(required_uom = 'ha')
 
-    expected_area = float(2 * 3) * 100.0 * 100.0 * maths.sqrt(3.0) / 2.0
+    expected_area = float(2 * 3) * 100.0 * 100.0 * root_3 / 2.0
     assert maths.isclose(area, expected_area)
     assert maths.isclose(area_m2, expected_area)
     assert maths.isclose(area_ha, expected_area / 10000.0)
@@ -580,7 +613,7 @@ def test_tri_mesh_area(example_model_and_crs):
     area_ha = trim2.area(required_uom = 'ha')
 
     # note: area is approximation based directly on proportion of non-NaN points, not area of triangles without NaN points
-    expected_area = (float(9) / float(12)) * float(2 * 3) * 100.0 * 100.0 * maths.sqrt(3.0) / 2.0
+    expected_area = (float(9) / float(12)) * float(2 * 3) * 100.0 * 100.0 * root_3 / 2.0
     assert maths.isclose(area, expected_area)
     assert maths.isclose(area_m2, expected_area)
     assert maths.isclose(area_ha, expected_area / 10000.0)
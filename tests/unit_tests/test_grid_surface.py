@@ -841,6 +841,29 @@ def test_bisector_from_faces_flat_surface_k_hole():
         rqgs.packed_bisector_from_face_indices(grid_extent_kji, k_face_indices, None, None, False, None)
 
 
+def test_bisector_from_face_indices_serpentine():
+    # Arrange
+    grid_extent_kji = (2, 5, 13)
+    # a snake shaped region which requires propagation back towards lower i indices when filling from (0, 0, 0);
+    # ni > 8 so that the packed fill has to carry bits across byte boundaries in both directions
+    region = np.zeros(grid_extent_kji, dtype = bool)
+    region[:, 0::2, :] = True
+    region[:, 1, 12] = True
+    region[:, 3, 0] = True
+    j_face_indices = np.stack(np.where(region[:, :-1, :] != region[:, 1:, :]), axis = -1).astype(np.int32)
+    i_face_indices = np.stack(np.where(region[:, :, :-1] != region[:, :, 1:]), axis = -1).astype(np.int32)
+
+    # Act
+    a, is_curtain = rqgs.bisector_from_face_indices(grid_extent_kji, None, j_face_indices, i_face_indices, True, None)
+    pa, packed_is_curtain = rqgs.packed_bisector_from_face_indices(grid_extent_kji, None, j_face_indices,
+                                                                   i_face_indices, True, None)
+
+    # Assert
+    assert a.shape == grid_extent_kji
+    assert np.array_equal(a, region) or np.array_equal(a, np.logical_not(region))
+    assert np.array_equal(np.unpackbits(pa, axis = -1, count = grid_extent_kji[2]).astype(bool), a)
+
+
 def test_shadow_from_faces_flat_surface_k_hole():
     # Arrange
     grid_extent_kji = (3, 3, 3)
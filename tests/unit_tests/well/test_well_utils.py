@@ -1,6 +1,8 @@
 import os
+from types import SimpleNamespace
 import numpy as np
 import pandas as pd
+import pytest
 from numpy.testing import assert_array_almost_equal
 from lxml import etree
 
@@ -10,13 +12,11 @@ from resqpy.well.well_utils import load_hdf5_array, load_lattice_array, extract_
 from resqpy.grid import RegularGrid
 
 
-def test_load_hdf5_array(example_model_with_well):
+@pytest.fixture(scope = 'module')
+def deviation_survey(shared_model_with_well):
+    """Returns a deviation survey, written to hdf5 and xml in the shared well model, together with its array data."""
 
-    # --------- Arrange ----------
-    # Create a Deviation Survey object in memory
-
-    # Load example model from a fixture
-    model, well_interp, datum, traj = example_model_with_well
+    model, well_interp, datum, _ = shared_model_with_well
 
     # Create a survey
     data = dict(
@@ -27,10 +27,10 @@ def test_load_hdf5_array(example_model_with_well):
         is_final = True,
     )
     array_data = dict(
-        measured_depths = np.array([1, 2, 3], dtype = float) + 1000.0,
-        azimuths = np.array([4, 5, 6], dtype = float),
-        inclinations = np.array([7, 8, 9], dtype = float),
-        first_station = np.array([0, -1, 999], dtype = float),
+        measured_depths = np.array([1001.0, 1002.0, 1003.0]),
+        azimuths = np.array([4.0, 5.0, 6.0]),
+        inclinations = np.array([7.0, 8.0, 9.0]),
+        first_station = np.array([0.0, -1.0, 999.0]),
     )
 
     survey = resqpy.well.DeviationSurvey(
@@ -40,17 +40,28 @@ def test_load_hdf5_array(example_model_with_well):
         **data,
         **array_data,
     )
-
-    # ----------- Act ---------
     survey.write_hdf5()
     survey.create_xml()
+
+    return survey, array_data
+
+
+def test_load_hdf5_array(deviation_survey):
+
+    # --------- Arrange ----------
+    # Deviation Survey written by a module fixture; its measured depths are loaded into a plain stub object
+    # so that the load is observable and the shared survey is left unmodified
+    survey, array_data = deviation_survey
+    holder = SimpleNamespace()
+
+    # ----------- Act ---------
     mds_node = rqet.find_tag(survey.root, 'Mds', must_exist = True)
     # the only purpose of the call is to ensure that the array is cached in memory so should return None
     # a copy of the whole array is cached in memory as an attribute of the object
-    expected_result = load_hdf5_array(survey, mds_node, 'measured_depths')
+    expected_result = load_hdf5_array(holder, mds_node, 'measured_depths', model = survey.model)
 
     # -------- Assert ---------
-    np.testing.assert_equal(survey.__dict__['measured_depths'], array_data['measured_depths'])
+    np.testing.assert_equal(holder.measured_depths, array_data['measured_depths'])
     assert expected_result is None
 
 
@@ -82,40 +93,13 @@ def test_load_lattice_array(example_model_with_well):
     np.testing.assert_equal(target_object.__dict__["node_mds"], expected_mds)
 
 
-def test_extract_xyz(example_model_with_well):
+def test_extract_xyz(deviation_survey):
 
     # --------- Arrange ----------
-    # Create a Deviation Survey object in memory
-
-    # Load example model from a fixture
-    model, well_interp, datum, traj = example_model_with_well
-
-    # Create a survey
-    data = dict(
-        title = 'Majestic Umlaut ö',
-        originator = 'Thor, god of sparkles',
-        md_uom = 'ft',
-        angle_uom = 'rad',
-        is_final = True,
-    )
-    array_data = dict(
-        measured_depths = np.array([1, 2, 3], dtype = float) + 1000.0,
-        azimuths = np.array([4, 5, 6], dtype = float),
-        inclinations = np.array([7, 8, 9], dtype = float),
-        first_station = np.array([0, -1, 999], dtype = float),
-    )
-
-    survey = resqpy.well.DeviationSurvey(
-        parent_model = model,
-        represented_interp = well_interp,
-        md_datum = datum,
-        **data,
-        **array_data,
-    )
+    # Deviation Survey object written by a module fixture
+    survey, array_data = deviation_survey
 
     # ----------- Act ---------
-    survey.write_hdf5()
-    survey.create_xml()
     first_station_node = rqet.find_tag(survey.root, 'FirstStationLocation', must_exist = True)
     first_station_xyz = extract_xyz(first_station_node)
 
@@ -198,18 +182,11 @@ def test_well_names_in_cellio_file(tmp_path):
             'Perm unit1 scale1', 'Poro unit1 scale1'
         ])
 
+    lines = ['1.0', 'Undefined', f'{well_name} terrible day', '11']
+    lines += [f' {col}' for col in source_df.columns]
+    lines += [''.join(f' {value}' for value in row) for row in source_df.to_numpy().astype(int)]
     with open(cellio_file, 'w') as fp:
-        fp.write('1.0\n')
-        fp.write('Undefined\n')
-        fp.write(f'{well_name} terrible day\n')
-        fp.write('11\n')
-        for col in source_df.columns:
-            fp.write(f' {col}\n')
-        for row_index in range(len(source_df)):
-            row = source_df.iloc[row_index]
-            for col in source_df.columns:
-                fp.write(f' {int(row[col])}')
-            fp.write('\n')
+        fp.write('\n'.join(lines) + '\n')
 
     # --------- Arrange ----------
     well_list = well_names_in_cellio_file(cellio_file = cellio_file)